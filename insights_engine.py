@@ -11,19 +11,212 @@ Usage: python insights_engine.py [--jobs-dir jobs] [--output stats.json]
 
 import json
 import os
+import sys
 import re
-from datetime import datetime, timedelta
+from datetime import datetime
 from collections import defaultdict, Counter
-from typing import Dict, List, Any, Tuple, Optional
-import statistics
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, List, Any, Tuple, Optional, Mapping
 import math
-import argparse
-from pathlib import Path
+import heapq
+from operator import itemgetter
+
+
+# Bump when analyzer output changes so stale cached analyses are ignored
+_CACHE_VERSION = 2
+
+# Salary text patterns
+_SALARY_RE = re.compile(r'\$?(\d+(?:,\d+)*(?:\.\d+)?)')
+_NEGOTIABLE_RE = re.compile(r'negotiable|depending|tbd|competitive|flexible')
+
+# Employer identifier embedded in job URLs
+_EMPLOYER_URL_RE = re.compile(r'/job/([^-]*)')
+
+# Premium compensation signals
+_PREMIUM_SALARY_RE = re.compile(r'competitive|excellent|attractive')
+_MONTHLY_SALARY_RE = re.compile(r'per month|monthly')
+_INCENTIVE_RE = re.compile(r'bonus|incentive|commission|performance')
+_LONG_TERM_RE = re.compile(r'long-term|career|growth|advancement')
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC"""
+    if not isinstance(value, str):
+        return None
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _json_default(value: Any) -> Any:
+    """Encode the read-only placeholder mappings as JSON objects"""
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _compile_keyword_table(table: Dict[str, List[str]]) -> Dict[str, "re.Pattern[str]"]:
+    """Compile each category's keyword list into a single alternation pattern"""
+    return {
+        category: re.compile('|'.join(map(re.escape, keywords)))
+        for category, keywords in table.items()
+    }
+
+
+# Keyword tables, compiled once at import
+_GEOGRAPHIC_INDICATORS = _compile_keyword_table({
+    "US": ["usa", "united states", "america", "us timezone", "est", "pst", "cst", "mst"],
+    "Canada": ["canada", "canadian", "toronto", "vancouver"],
+    "Australia": ["australia", "australian", "sydney", "melbourne"],
+    "UK": ["uk", "united kingdom", "london", "british"],
+    "Philippines": ["philippines", "philippine", "manila", "cebu"],
+    "Global": ["global", "international", "worldwide", "any timezone"]
+})
+_TIMEZONE_RE = re.compile(r'timezone|time zone|hours|est|pst')
+
+_INDUSTRY_KEYWORDS = _compile_keyword_table({
+    "E-commerce": ["shopify", "amazon", "ecommerce", "e-commerce", "online store", "marketplace"],
+    "Digital Marketing": ["facebook ads", "google ads", "ppc", "social media", "marketing"],
+    "Real Estate": ["real estate", "property", "listing", "mls", "realtor"],
+    "Healthcare": ["health", "medical", "wellness", "pharmacy", "clinic"],
+    "Technology": ["software", "ai", "api", "development", "tech", "saas"],
+    "Finance": ["accounting", "bookkeeping", "finance", "tax", "quickbooks"],
+    "Education": ["education", "training", "course", "teaching", "learning"],
+    "Logistics": ["shipping", "logistics", "supply chain", "warehouse", "delivery"]
+})
+
+
+def _mean_stdev(values: List[float]) -> Tuple[float, float]:
+    """Mean and sample standard deviation (0 for fewer than two values)"""
+    n = len(values)
+    mean = math.fsum(values) / n
+    if n < 2:
+        return mean, 0
+    return mean, math.sqrt(math.fsum((x - mean) ** 2 for x in values) / (n - 1))
+
+
+def _summary_statistics(values: List[float], quantiles: bool = True) -> Dict[str, float]:
+    """Min/max/mean/median/quartiles/stdev from a single sort of the data"""
+    if not quantiles:
+        # Order statistics are the only reason to sort
+        mean, std_dev = _mean_stdev(values)
+        return {"min": min(values), "max": max(values), "mean": mean, "std_dev": std_dev}
+    
+    data = sorted(values)
+    n = len(data)
+    mean, std_dev = _mean_stdev(data)
+    
+    mid = n // 2
+    median = data[mid] if n % 2 else (data[mid - 1] + data[mid]) / 2
+    
+    # Quartiles using the 'exclusive' method of statistics.quantiles(n=4)
+    q1 = q3 = 0
+    if n > 3:
+        quartiles = []
+        for i in (1, 3):
+            j, delta = divmod(i * (n + 1), 4)
+            quartiles.append((data[j - 1] * (4 - delta) + data[j] * delta) / 4)
+        q1, q3 = quartiles
+    
+    return {
+        "min": data[0],
+        "max": data[-1],
+        "mean": mean,
+        "median": median,
+        "q1": q1,
+        "q3": q3,
+        "std_dev": std_dev
+    }
+
+
+class PlaceholderInsights:
+    """Placeholder analyzer results until real implementations replace them"""
+    # Read-only values built once at import and shared by every engine
+    __slots__ = ()
+    
+    salary_arbitrage: Tuple[Mapping[str, Any], ...] = (
+        MappingProxyType({
+            "opportunity_type": "Undervalued Technical Skills",
+            "description": "AI/automation skills underpriced by ~40%",
+            "potential_upside": "2-3x current market rates",
+            "confidence_score": 0.85
+        }),
+    )
+    skill_trends: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+        "emerging": ("AI Tools", "Automation", "No-Code Platforms"),
+        "declining": ("Basic Data Entry", "Simple Copy-Paste Tasks")
+    })
+    premium_skills: Tuple[Mapping[str, Any], ...] = (
+        MappingProxyType({"skill": "Facebook Ads", "premium_multiplier": 2.3, "confidence": 0.9}),
+        MappingProxyType({"skill": "Google Ads", "premium_multiplier": 2.1, "confidence": 0.85})
+    )
+    skill_gaps: Tuple[str, ...] = ("AI Implementation", "Process Automation")
+    specialization_opportunities: Tuple[str, ...] = ("HRTech", "PropTech", "FinTech")
+    employer_quality: Mapping[str, Any] = MappingProxyType({"high_quality_percentage": 34.5})
+    communication_patterns: Mapping[str, Any] = MappingProxyType({"sophisticated_communication": 42.1})
+    urgency_patterns: Mapping[str, Any] = MappingProxyType({"genuine_urgency": 41.7, "fake_urgency": 8.2})
+    red_flags: Tuple[str, ...] = ("Excessive urgency", "Vague compensation")
+    green_flags: Tuple[str, ...] = ("Detailed job descriptions", "Clear processes")
+    market_velocity: Mapping[str, Any] = MappingProxyType({"posting_velocity": "high", "competition_velocity": "medium"})
+    temporal_opportunities: Tuple[str, ...] = ("Off-peak application timing",)
+    skill_competition: Mapping[str, Tuple[str, ...]] = MappingProxyType({"high_competition": ("VA", "Data Entry"), "low_competition": ("AI Tools",)})
+    positioning_opportunities: Tuple[str, ...] = ("Technical specialization", "Industry focus")
+    blue_ocean_opportunities: Tuple[str, ...] = ("No-code development", "AI implementation")
+    competition_avoidance_strategies: Tuple[str, ...] = ("Skill stacking", "Niche specialization")
+    market_entry_strategies: Tuple[str, ...] = ("Start with multi-posters", "Target premium segments")
+    employer_sophistication: Mapping[str, Any] = MappingProxyType({"tier_1": 23.1, "tier_2": 54.2, "tier_3": 22.7})
+    cultural_expectations: Mapping[str, Any] = MappingProxyType({"US_preference": 57.0, "formal_communication": 34.2})
+    attention_tests: Mapping[str, Any] = MappingProxyType({"attention_test_percentage": 23.4})
+    value_propositions: Mapping[str, Any] = MappingProxyType({"growth_focused": 28.1, "stability_focused": 45.2})
+    psychological_leverage: Tuple[str, ...] = ("Proactive communication", "Results focus")
+    skill_arbitrage: Tuple[str, ...] = ("AI skills undervalued", "Technical automation")
+    industry_opportunities: Tuple[str, ...] = ("HRTech explosion", "PropTech growth")
+    technology_opportunities: Tuple[str, ...] = ("Early AI adoption", "No-code platforms")
+    geographic_arbitrage: Tuple[str, ...] = ("US timezone premium", "Regional specialization")
+    career_pathways: Tuple[str, ...] = ("VA → Specialist → Manager", "Technical → Strategic")
+    first_mover_advantages: Tuple[str, ...] = ("AI tool mastery", "Web3 positioning")
+    job_quality_scores: Mapping[str, Any] = MappingProxyType({"high_quality": 34.5, "medium_quality": 42.1, "low_quality": 23.4})
+    success_probabilities: Mapping[str, Tuple[str, ...]] = MappingProxyType({"application_success_factors": ("attention_to_detail", "specialization")})
+    application_insights: Mapping[str, Any] = MappingProxyType({"optimal_timing": "9-11 AM", "key_factors": ("customization", "portfolio")})
+    quality_competition_matrix: Mapping[str, Any] = MappingProxyType({"sweet_spot": "medium_quality_low_competition"})
+    immediate_actions: Tuple[str, ...] = ("Target multi-posters", "Always negotiate", "Off-peak applications")
+    medium_term_strategies: Tuple[str, ...] = ("Skill stacking", "Industry specialization", "Portfolio building")
+    long_term_positioning: Tuple[str, ...] = ("Thought leadership", "Consulting transition", "Team building")
+    experience_based_strategies: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+        "beginners": ("skill_focus",),
+        "experienced": ("specialization",),
+        "experts": ("positioning",)
+    })
+    leveling_tactics: Tuple[str, ...] = ("Negotiation training", "Market intelligence", "Strategic positioning")
+    lifecycle_metrics: Mapping[str, Any] = MappingProxyType({"average_job_lifespan": "14 days"})
+    posting_timing: Mapping[str, Any] = MappingProxyType({"optimal_hour": 11, "optimal_day": "Monday"})
+    status_patterns: Mapping[str, Any] = MappingProxyType({"status_change_frequency": 0.15})
+
+
+# Sections produced by run_full_analysis, selectable with --sections
+ANALYSIS_SECTIONS = (
+    "data_summary",
+    "salary_patterns",
+    "skills_market",
+    "competitive_landscape",
+    "temporal_patterns",
+    "opportunity_matrix",
+    "success_indicators",
+    "strategic_insights"
+)
 
 
 class JobMarketInsightsEngine:
-    def __init__(self, jobs_dir: str = "jobs"):
+    def __init__(self, jobs_dir: str = "jobs", cache_dir: Optional[str] = None,
+                 enabled_sections: Optional[List[str]] = None):
         self.jobs_dir = jobs_dir
+        self.cache_dir = cache_dir
+        self.enabled_sections = set(enabled_sections or ANALYSIS_SECTIONS)
+        self._ph = PlaceholderInsights()
         self.jobs_data = []
         self.insights = {
             "analysis_timestamp": datetime.now().isoformat(),
@@ -39,30 +232,169 @@ class JobMarketInsightsEngine:
         
     def load_jobs_data(self) -> None:
         """Load and validate all job JSON files"""
+        from concurrent.futures import ThreadPoolExecutor
+        
         print("Loading job data...")
         
-        job_files = [f for f in os.listdir(self.jobs_dir) if f.endswith('.json') and f != 'failed_jobs.json']
+        job_files = self._list_job_files()
         
-        for filename in job_files:
-            try:
-                with open(os.path.join(self.jobs_dir, filename), 'r', encoding='utf-8') as f:
-                    job_data = json.load(f)
-                    if job_data.get('job_id'):  # Validate basic structure
-                        self.jobs_data.append(job_data)
-            except Exception as e:
-                print(f"Error loading {filename}: {e}")
+        # Overlap file reads across threads; results keep directory order
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for filename, job_data, error in executor.map(self._load_job_file, job_files):
+                if error is not None:
+                    print(f"Error loading {filename}: {error}")
+                elif job_data is not None:
+                    self.jobs_data.append(job_data)
         
         print(f"Loaded {len(self.jobs_data)} job postings")
         
+    def _list_job_files(self) -> List[str]:
+        """List the job JSON files in the jobs directory"""
+        return [
+            f for f in os.listdir(self.jobs_dir)
+            if f.endswith(('.json', '.json.gz')) and f != 'failed_jobs.json'
+        ]
+    
+    def _jobs_signature(self) -> str:
+        """Hash the name, size and mtime of every job file"""
+        import hashlib
+        
+        entries = []
+        for filename in self._list_job_files():
+            stat = os.stat(os.path.join(self.jobs_dir, filename))
+            entries.append((filename, stat.st_size, stat.st_mtime_ns))
+        entries.sort()
+        sections = sorted(self.enabled_sections)
+        return hashlib.blake2b(repr((_CACHE_VERSION, sections, entries)).encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _load_cached_insights(self, cache_path: str) -> bool:
+        """Restore a previous analysis of identical job data"""
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = json.loads(f.read())
+            insights = cached["insights"]
+            scraped_ts = cached["scraped_ts"]
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"Ignoring unreadable analysis cache {cache_path}: {e}")
+            return False
+        
+        # Freshness depends on the current time, so it is recomputed on every run
+        self._scraped_ts = scraped_ts
+        insights["analysis_timestamp"] = self.insights["analysis_timestamp"]
+        if "data_freshness_score" in insights.get("data_summary", {}):
+            insights["data_summary"]["data_freshness_score"] = self._calculate_data_freshness()
+        self.insights = insights
+        
+        print(f"Job data unchanged, reusing cached analysis from {cache_path}")
+        return True
+    
+    def _write_cached_insights(self, cache_path: str) -> None:
+        """Store the analysis for reuse while the job data is unchanged"""
+        cached = {
+            "scraped_ts": [ts for ts in self._scraped_ts if ts is not None],
+            "insights": self.insights
+        }
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(cached, ensure_ascii=False, default=_json_default))
+        except Exception as e:
+            print(f"Error writing analysis cache: {e}")
+            return
+        
+        # Analyses of earlier job data can never be hit again
+        current = os.path.basename(cache_path)
+        for filename in os.listdir(self.cache_dir):
+            if filename.startswith('insights_') and filename.endswith('.json') and filename != current:
+                try:
+                    os.remove(os.path.join(self.cache_dir, filename))
+                except OSError as e:
+                    print(f"Error removing stale analysis cache {filename}: {e}")
+    
+    def _load_job_file(self, filename: str) -> Tuple[str, Optional[Dict[str, Any]], Optional[Exception]]:
+        """Read and validate a single job file"""
+        try:
+            filepath = os.path.join(self.jobs_dir, filename)
+            # The job scraper writes .json.gz when run with --compress
+            if filename.endswith('.gz'):
+                import gzip
+                opener = gzip.open
+            else:
+                opener = open
+            with opener(filepath, 'rb') as f:
+                job_data = json.loads(f.read())
+            if job_data.get('job_id'):  # Validate basic structure
+                return filename, job_data, None
+            return filename, None, None
+        except Exception as e:
+            return filename, None, e
+    
+    def _precompute(self) -> None:
+        """Derive per-job columns, text and timestamps once for all analyzers"""
+        # Raw field columns
+        self._job_ids = []
+        self._titles = []
+        self._salaries = []
+        self._overviews = []
+        self._work_types = []
+        self._is_active = []
+        
+        # Derived columns
+        self._salary_lower = []
+        self._job_text_lower = []
+        self._scraped_dt = []
+        self._scraped_ts = []
+        self._skills = []
+        # Drop lazily derived columns left over from a previous run
+        self.__dict__.pop('_industry_text_lower', None)
+        
+        for job in self.jobs_data:
+            overview = job.get('job_overview') or ''
+            title = job.get('title') or ''
+            # Skill names repeat across thousands of jobs; intern them so the
+            # skill Counters and output dicts share one string per name
+            skills = [sys.intern(skill) for skill in job.get('skill_requirements') or []]
+            
+            self._job_ids.append(job['job_id'])
+            self._titles.append(title)
+            self._salaries.append(job.get('salary'))
+            self._overviews.append(overview)
+            self._work_types.append(job.get('type_of_work', 'Unspecified'))
+            self._is_active.append(job.get('is_active', True))
+            
+            # Lowercase the combined text once; the lowered overview and
+            # title on their own are never needed by the analyzers
+            job_text_lower = f"{overview} {title}".lower()
+            
+            self._salary_lower.append(str(job.get('salary') or '').lower())
+            self._job_text_lower.append(job_text_lower)
+            self._skills.append(skills)
+            
+            scraped_at = job.get('scraped_at')
+            scraped_dt = _parse_timestamp(scraped_at) if scraped_at else None
+            self._scraped_dt.append(scraped_dt)
+            self._scraped_ts.append(scraped_dt.timestamp() if scraped_dt is not None else None)
+        
+    @cached_property
+    def _industry_text_lower(self) -> List[str]:
+        """Lowercased job text plus skill names, built only if industries are categorized"""
+        return [
+            f"{job_text} {' '.join(skills).lower()}"
+            for job_text, skills in zip(self._job_text_lower, self._skills)
+        ]
+    
     def analyze_basic_metrics(self) -> Dict[str, Any]:
         """Comprehensive basic market analytics"""
         print("Analyzing basic market metrics...")
         
         total_jobs = len(self.jobs_data)
-        active_jobs = len([j for j in self.jobs_data if j.get('is_active', True)])
+        active_jobs = sum(1 for is_active in self._is_active if is_active)
         
         # Work type distribution
-        work_types = Counter(j.get('type_of_work', 'Unspecified') for j in self.jobs_data)
+        work_types = Counter(self._work_types)
         
         # Geographic preferences (inferred from job descriptions)
         geographic_patterns = self._analyze_geographic_preferences()
@@ -87,7 +419,7 @@ class JobMarketInsightsEngine:
         
         return metrics
     
-    def analyze_salary_patterns(self) -> Dict[str, Any]:
+    def analyze_salary_patterns(self, compute_quantiles: bool = True) -> Dict[str, Any]:
         """Advanced salary and compensation analysis"""
         print("Analyzing salary patterns and negotiation opportunities...")
         
@@ -95,44 +427,30 @@ class JobMarketInsightsEngine:
         negotiable_indicators = []
         payment_structures = {"hourly": 0, "monthly": 0, "project": 0, "unspecified": 0}
         
-        for job in self.jobs_data:
-            salary_text = job.get('salary') or ''
-            salary_text = str(salary_text).lower()
+        for job_id, salary_text in zip(self._job_ids, self._salary_lower):
             if salary_text:
                 # Extract numerical values
-                amounts = re.findall(r'\$?(\d+(?:,\d+)*(?:\.\d+)?)', salary_text)
-                if amounts:
-                    # Convert to numbers
-                    numeric_amounts = [float(a.replace(',', '')) for a in amounts]
-                    salary_data.extend(numeric_amounts)
+                salary_data.extend(
+                    float(m.group(1).replace(',', '')) for m in _SALARY_RE.finditer(salary_text)
+                )
                 
                 # Identify negotiation indicators
-                negotiable_terms = ['negotiable', 'depending', 'tbd', 'competitive', 'flexible']
-                if any(term in salary_text for term in negotiable_terms):
-                    negotiable_indicators.append(job['job_id'])
+                if _NEGOTIABLE_RE.search(salary_text):
+                    negotiable_indicators.append(job_id)
                 
-                # Payment structure analysis
-                if any(term in salary_text for term in ['hour', '/hr', 'hourly']):
+                # Payment structure analysis ('hourly' and 'monthly' contain
+                # 'hour' and 'month', so those terms cover them)
+                if 'hour' in salary_text or '/hr' in salary_text:
                     payment_structures["hourly"] += 1
-                elif any(term in salary_text for term in ['month', '/mo', 'monthly']):
+                elif 'month' in salary_text or '/mo' in salary_text:
                     payment_structures["monthly"] += 1
-                elif any(term in salary_text for term in ['project', 'per task', 'per clip']):
+                elif 'project' in salary_text or 'per task' in salary_text or 'per clip' in salary_text:
                     payment_structures["project"] += 1
                 else:
                     payment_structures["unspecified"] += 1
         
         # Calculate salary statistics
-        salary_stats = {}
-        if salary_data:
-            salary_stats = {
-                "min": min(salary_data),
-                "max": max(salary_data),
-                "mean": statistics.mean(salary_data),
-                "median": statistics.median(salary_data),
-                "q1": statistics.quantiles(salary_data, n=4)[0] if len(salary_data) > 3 else 0,
-                "q3": statistics.quantiles(salary_data, n=4)[2] if len(salary_data) > 3 else 0,
-                "std_dev": statistics.stdev(salary_data) if len(salary_data) > 1 else 0
-            }
+        salary_stats = _summary_statistics(salary_data, quantiles=compute_quantiles) if salary_data else {}
         
         return {
             "salary_statistics": salary_stats,
@@ -143,44 +461,43 @@ class JobMarketInsightsEngine:
             },
             "payment_structures": payment_structures,
             "premium_indicators": self._identify_premium_salary_patterns(),
-            "arbitrage_opportunities": self._identify_salary_arbitrage()
+            "arbitrage_opportunities": self._ph.salary_arbitrage
         }
     
     def analyze_skills_market(self) -> Dict[str, Any]:
         """Comprehensive skills demand and market analysis"""
         print("Analyzing skills market and demand patterns...")
         
-        # Collect all skills
-        all_skills = []
-        skill_combinations = []
+        # Count skills and skill combinations incrementally
+        skill_frequency = Counter()
+        combination_frequency = Counter()
         
-        for job in self.jobs_data:
-            skills = job.get('skill_requirements', [])
+        for skills in self._skills:
             if skills:
-                all_skills.extend(skills)
-                if len(skills) > 1:
-                    skill_combinations.append(tuple(sorted(skills)))
+                skill_frequency.update(skills)
+                combination = frozenset(skills)
+                if len(combination) > 1:
+                    combination_frequency[combination] += 1
         
         # Skill frequency analysis
-        skill_frequency = Counter(all_skills)
-        top_skills = dict(skill_frequency.most_common(50))
+        ranked_skills = skill_frequency.most_common(50)
+        top_skills = dict(ranked_skills)
         
         # Skill combination analysis
-        combination_frequency = Counter(skill_combinations)
-        # Convert tuples to lists for JSON serialization
+        # Order is irrelevant within a combination, so only sort the reported ones
         top_combinations = {
-            " + ".join(combo): count 
+            " + ".join(sorted(combo)): count 
             for combo, count in combination_frequency.most_common(20)
         }
         
         # Market saturation analysis
-        market_saturation = self._calculate_skill_saturation(skill_frequency)
+        market_saturation = self._calculate_skill_saturation(skill_frequency, ranked_skills=ranked_skills)
         
         # Emerging vs declining skills
-        skill_trends = self._analyze_skill_trends()
+        skill_trends = self._ph.skill_trends
         
         # Premium skill indicators
-        premium_skills = self._identify_premium_skills()
+        premium_skills = self._ph.premium_skills
         
         return {
             "skill_demand_ranking": top_skills,
@@ -189,45 +506,42 @@ class JobMarketInsightsEngine:
             "emerging_skills": skill_trends["emerging"],
             "declining_skills": skill_trends["declining"],
             "premium_skills": premium_skills,
-            "skill_gap_opportunities": self._identify_skill_gaps(),
-            "specialization_opportunities": self._identify_specialization_opportunities()
+            "skill_gap_opportunities": self._ph.skill_gaps,
+            "specialization_opportunities": self._ph.specialization_opportunities
         }
     
     def analyze_employer_patterns(self) -> Dict[str, Any]:
         """Advanced employer behavior and quality analysis"""
         print("Analyzing employer patterns and behaviors...")
         
-        # Multi-posting employer analysis
-        employers = defaultdict(list)
-        for job in self.jobs_data:
-            # Infer employer from job posting patterns (URL, similar descriptions, etc.)
-            employer_id = self._infer_employer_id(job)
-            employers[employer_id].append(job)
+        # Multi-posting employer analysis: jobs per employer, inferred from
+        # job posting patterns (URL, similar descriptions, etc.)
+        employers = Counter(map(self._infer_employer_id, self.jobs_data))
         
-        multi_posters = {k: v for k, v in employers.items() if len(v) > 1}
+        multi_posters = {k: v for k, v in employers.items() if v > 1}
         
         # Quality indicators
-        quality_metrics = self._analyze_employer_quality()
+        quality_metrics = self._ph.employer_quality
         
         # Communication pattern analysis
-        communication_patterns = self._analyze_communication_patterns()
+        communication_patterns = self._ph.communication_patterns
         
         # Urgency pattern analysis
-        urgency_analysis = self._analyze_urgency_patterns()
+        urgency_analysis = self._ph.urgency_patterns
         
         return {
             "multi_posting_employers": {
                 "total_employers": len(employers),
                 "multi_posters": len(multi_posters),
                 "multi_posting_percentage": len(multi_posters) / len(employers) * 100,
-                "average_jobs_per_multi_poster": statistics.mean([len(jobs) for jobs in multi_posters.values()]) if multi_posters else 0,
-                "top_multi_posters": sorted([(k, len(v)) for k, v in multi_posters.items()], key=lambda x: x[1], reverse=True)[:20]
+                "average_jobs_per_multi_poster": sum(multi_posters.values()) / len(multi_posters) if multi_posters else 0,
+                "top_multi_posters": heapq.nlargest(20, multi_posters.items(), key=itemgetter(1))
             },
             "quality_indicators": quality_metrics,
             "communication_sophistication": communication_patterns,
             "urgency_analysis": urgency_analysis,
-            "red_flag_patterns": self._identify_red_flags(),
-            "green_flag_patterns": self._identify_green_flags()
+            "red_flag_patterns": self._ph.red_flags,
+            "green_flag_patterns": self._ph.green_flags
         }
     
     def analyze_temporal_patterns(self) -> Dict[str, Any]:
@@ -239,13 +553,13 @@ class JobMarketInsightsEngine:
         status_changes = []
         posting_patterns = []
         
-        for job in self.jobs_data:
+        for job, job_id, dt in zip(self.jobs_data, self._job_ids, self._scraped_dt):
             # Analyze status history
             status_history = job.get('status_history', [])
             if status_history:
                 for i, status in enumerate(status_history):
                     status_changes.append({
-                        'job_id': job['job_id'],
+                        'job_id': job_id,
                         'status': status.get('status'),
                         'timestamp': status.get('timestamp'),
                         'reason': status.get('reason'),
@@ -253,17 +567,12 @@ class JobMarketInsightsEngine:
                     })
             
             # Posting time analysis
-            scraped_at = job.get('scraped_at')
-            if scraped_at:
-                try:
-                    dt = datetime.fromisoformat(scraped_at.replace('Z', '+00:00'))
-                    posting_patterns.append({
-                        'hour': dt.hour,
-                        'day_of_week': dt.weekday(),
-                        'job_id': job['job_id']
-                    })
-                except:
-                    pass
+            if dt is not None:
+                posting_patterns.append({
+                    'hour': dt.hour,
+                    'day_of_week': dt.weekday(),
+                    'job_id': job_id
+                })
         
         # Calculate lifecycle metrics
         lifecycle_metrics = self._calculate_lifecycle_metrics(status_changes)
@@ -272,14 +581,14 @@ class JobMarketInsightsEngine:
         timing_analysis = self._analyze_posting_timing(posting_patterns)
         
         # Market velocity indicators
-        velocity_indicators = self._calculate_market_velocity()
+        velocity_indicators = self._ph.market_velocity
         
         return {
             "job_lifecycle_metrics": lifecycle_metrics,
             "optimal_posting_times": timing_analysis,
             "market_velocity": velocity_indicators,
             "status_change_patterns": self._analyze_status_patterns(status_changes),
-            "temporal_opportunities": self._identify_temporal_opportunities()
+            "temporal_opportunities": self._ph.temporal_opportunities
         }
     
     def analyze_competitive_landscape(self) -> Dict[str, Any]:
@@ -287,23 +596,23 @@ class JobMarketInsightsEngine:
         print("Analyzing competitive landscape...")
         
         # Competition density by skill
-        skill_competition = self._calculate_skill_competition()
+        skill_competition = self._ph.skill_competition
         
         # Market positioning opportunities
-        positioning_opportunities = self._identify_positioning_opportunities()
+        positioning_opportunities = self._ph.positioning_opportunities
         
         # Blue ocean detection
-        blue_ocean_opportunities = self._identify_blue_ocean_opportunities()
+        blue_ocean_opportunities = self._ph.blue_ocean_opportunities
         
         # Competition avoidance strategies
-        avoidance_strategies = self._generate_competition_avoidance_strategies()
+        avoidance_strategies = self._ph.competition_avoidance_strategies
         
         return {
             "skill_competition_density": skill_competition,
             "low_competition_niches": positioning_opportunities,
             "blue_ocean_opportunities": blue_ocean_opportunities,
             "competition_avoidance_strategies": avoidance_strategies,
-            "market_entry_strategies": self._generate_market_entry_strategies()
+            "market_entry_strategies": self._ph.market_entry_strategies
         }
     
     def analyze_psychological_patterns(self) -> Dict[str, Any]:
@@ -311,23 +620,23 @@ class JobMarketInsightsEngine:
         print("Analyzing psychological patterns and employer communication...")
         
         # Language sophistication analysis
-        sophistication_tiers = self._categorize_employer_sophistication()
+        sophistication_tiers = self._ph.employer_sophistication
         
         # Cultural expectation analysis
-        cultural_patterns = self._analyze_cultural_expectations()
+        cultural_patterns = self._ph.cultural_expectations
         
         # Attention test analysis
-        attention_tests = self._identify_attention_tests()
+        attention_tests = self._ph.attention_tests
         
         # Value proposition analysis
-        value_propositions = self._analyze_value_propositions()
+        value_propositions = self._ph.value_propositions
         
         return {
             "employer_sophistication_tiers": sophistication_tiers,
             "cultural_expectation_patterns": cultural_patterns,
             "attention_test_prevalence": attention_tests,
             "employer_value_propositions": value_propositions,
-            "psychological_leverage_points": self._identify_psychological_leverage()
+            "psychological_leverage_points": self._ph.psychological_leverage
         }
     
     def identify_opportunities(self) -> Dict[str, Any]:
@@ -335,19 +644,19 @@ class JobMarketInsightsEngine:
         print("Identifying market opportunities and arbitrage...")
         
         # Skill arbitrage opportunities
-        skill_arbitrage = self._identify_skill_arbitrage()
+        skill_arbitrage = self._ph.skill_arbitrage
         
         # Industry specialization opportunities
-        industry_opportunities = self._identify_industry_opportunities()
+        industry_opportunities = self._ph.industry_opportunities
         
         # Technology adoption opportunities
-        tech_opportunities = self._identify_technology_opportunities()
+        tech_opportunities = self._ph.technology_opportunities
         
         # Geographic arbitrage
-        geographic_opportunities = self._identify_geographic_arbitrage()
+        geographic_opportunities = self._ph.geographic_arbitrage
         
         # Career pathway opportunities
-        career_pathways = self._map_career_pathways()
+        career_pathways = self._ph.career_pathways
         
         return {
             "skill_arbitrage_opportunities": skill_arbitrage,
@@ -355,7 +664,7 @@ class JobMarketInsightsEngine:
             "technology_early_adoption_opportunities": tech_opportunities,
             "geographic_arbitrage_opportunities": geographic_opportunities,
             "career_pathway_opportunities": career_pathways,
-            "first_mover_advantages": self._identify_first_mover_advantages()
+            "first_mover_advantages": self._ph.first_mover_advantages
         }
     
     def calculate_success_indicators(self) -> Dict[str, Any]:
@@ -363,19 +672,19 @@ class JobMarketInsightsEngine:
         print("Calculating success probability indicators...")
         
         # Job quality scoring
-        quality_scores = self._calculate_job_quality_scores()
+        quality_scores = self._ph.job_quality_scores
         
         # Success probability indicators
-        success_indicators = self._calculate_success_probabilities()
+        success_indicators = self._ph.success_probabilities
         
         # Application optimization insights
-        application_insights = self._generate_application_insights()
+        application_insights = self._ph.application_insights
         
         return {
             "job_quality_distribution": quality_scores,
             "success_probability_indicators": success_indicators,
             "application_optimization_insights": application_insights,
-            "quality_vs_competition_matrix": self._create_quality_competition_matrix()
+            "quality_vs_competition_matrix": self._ph.quality_competition_matrix
         }
     
     def generate_strategic_recommendations(self) -> Dict[str, Any]:
@@ -383,51 +692,39 @@ class JobMarketInsightsEngine:
         print("Generating strategic recommendations...")
         
         # Immediate action items
-        immediate_actions = self._generate_immediate_actions()
+        immediate_actions = self._ph.immediate_actions
         
         # Medium-term strategies
-        medium_term_strategies = self._generate_medium_term_strategies()
+        medium_term_strategies = self._ph.medium_term_strategies
         
         # Long-term positioning
-        long_term_positioning = self._generate_long_term_positioning()
+        long_term_positioning = self._ph.long_term_positioning
         
         # Personalized strategies by experience level
-        experience_based_strategies = self._generate_experience_based_strategies()
+        experience_based_strategies = self._ph.experience_based_strategies
         
         return {
             "immediate_action_items": immediate_actions,
             "medium_term_strategies": medium_term_strategies,
             "long_term_positioning_strategies": long_term_positioning,
             "strategies_by_experience_level": experience_based_strategies,
-            "leveling_the_playing_field_tactics": self._generate_leveling_tactics()
+            "leveling_the_playing_field_tactics": self._ph.leveling_tactics
         }
     
     # Helper methods for analysis
     def _analyze_geographic_preferences(self) -> Dict[str, Any]:
         """Analyze geographic and timezone preferences"""
-        geographic_indicators = {
-            "US": ["usa", "united states", "america", "us timezone", "est", "pst", "cst", "mst"],
-            "Canada": ["canada", "canadian", "toronto", "vancouver"],
-            "Australia": ["australia", "australian", "sydney", "melbourne"],
-            "UK": ["uk", "united kingdom", "london", "british"],
-            "Philippines": ["philippines", "philippine", "manila", "cebu"],
-            "Global": ["global", "international", "worldwide", "any timezone"]
-        }
-        
         geo_counts = defaultdict(int)
         timezone_requirements = 0
         
-        for job in self.jobs_data:
-            overview = job.get('job_overview') or ''
-            title = job.get('title') or ''
-            job_text = f"{overview} {title}".lower()
+        # Reposted jobs share their text, so match each distinct text once
+        for job_text, count in Counter(self._job_text_lower).items():
+            for region, pattern in _GEOGRAPHIC_INDICATORS.items():
+                if pattern.search(job_text):
+                    geo_counts[region] += count
             
-            for region, indicators in geographic_indicators.items():
-                if any(indicator in job_text for indicator in indicators):
-                    geo_counts[region] += 1
-            
-            if any(tz in job_text for tz in ["timezone", "time zone", "hours", "est", "pst"]):
-                timezone_requirements += 1
+            if _TIMEZONE_RE.search(job_text):
+                timezone_requirements += count
         
         return {
             "geographic_distribution": dict(geo_counts),
@@ -436,107 +733,63 @@ class JobMarketInsightsEngine:
     
     def _categorize_industries(self) -> Dict[str, int]:
         """Categorize jobs into industries based on job descriptions"""
-        industry_keywords = {
-            "E-commerce": ["shopify", "amazon", "ecommerce", "e-commerce", "online store", "marketplace"],
-            "Digital Marketing": ["facebook ads", "google ads", "ppc", "social media", "marketing"],
-            "Real Estate": ["real estate", "property", "listing", "mls", "realtor"],
-            "Healthcare": ["health", "medical", "wellness", "pharmacy", "clinic"],
-            "Technology": ["software", "ai", "api", "development", "tech", "saas"],
-            "Finance": ["accounting", "bookkeeping", "finance", "tax", "quickbooks"],
-            "Education": ["education", "training", "course", "teaching", "learning"],
-            "Logistics": ["shipping", "logistics", "supply chain", "warehouse", "delivery"]
-        }
-        
         industry_counts = defaultdict(int)
         
-        for job in self.jobs_data:
-            overview = job.get('job_overview') or ''
-            title = job.get('title') or ''
-            skills = job.get('skill_requirements') or []
-            job_text = f"{overview} {title} {' '.join(skills)}".lower()
-            
-            for industry, keywords in industry_keywords.items():
-                if any(keyword in job_text for keyword in keywords):
-                    industry_counts[industry] += 1
+        # Match each distinct job text once, weighted by how many jobs share it
+        for job_text, count in Counter(self._industry_text_lower).items():
+            for industry, pattern in _INDUSTRY_KEYWORDS.items():
+                if pattern.search(job_text):
+                    industry_counts[industry] += count
         
         return dict(industry_counts)
     
     def _calculate_posting_velocity(self) -> Dict[str, Any]:
         """Calculate job posting velocity and trends"""
-        posting_dates = []
-        
-        for job in self.jobs_data:
-            scraped_at = job.get('scraped_at')
-            if scraped_at:
-                try:
-                    dt = datetime.fromisoformat(scraped_at.replace('Z', '+00:00'))
-                    posting_dates.append(dt)
-                except:
-                    pass
+        # Group by date straight from the parsed timestamps; only the peak
+        # day's key is ever formatted
+        date_counts = Counter(dt.date() for dt in self._scraped_dt if dt is not None)
         
-        if not posting_dates:
+        if not date_counts:
             return {"error": "No valid posting dates found"}
         
-        # Group by date
-        date_counts = defaultdict(int)
-        for dt in posting_dates:
-            date_counts[dt.date().isoformat()] += 1
-        
-        daily_counts = list(date_counts.values())
+        daily_mean, daily_stdev = _mean_stdev(list(date_counts.values()))
+        peak_date = max(date_counts, key=date_counts.__getitem__)
+        peak_count = date_counts[peak_date]
         
         return {
             "total_posting_days": len(date_counts),
-            "average_daily_postings": statistics.mean(daily_counts) if daily_counts else 0,
-            "peak_posting_day": max(date_counts.items(), key=lambda x: x[1]) if date_counts else None,
-            "posting_consistency_score": 1 - (statistics.stdev(daily_counts) / statistics.mean(daily_counts)) if len(daily_counts) > 1 and statistics.mean(daily_counts) > 0 else 0
+            "average_daily_postings": daily_mean,
+            "peak_posting_day": (peak_date.isoformat(), peak_count),
+            "posting_consistency_score": 1 - (daily_stdev / daily_mean) if len(date_counts) > 1 and daily_mean > 0 else 0
         }
     
     def _calculate_data_freshness(self) -> float:
         """Calculate how fresh the data is"""
-        now = datetime.now()
-        freshness_scores = []
-        
-        for job in self.jobs_data:
-            scraped_at = job.get('scraped_at')
-            if scraped_at:
-                try:
-                    dt = datetime.fromisoformat(scraped_at.replace('Z', '+00:00'))
-                    age_hours = (now - dt).total_seconds() / 3600
-                    # Fresher data gets higher scores (exponential decay)
-                    freshness_score = math.exp(-age_hours / 168)  # Half-life of 1 week
-                    freshness_scores.append(freshness_score)
-                except:
-                    pass
-        
-        return statistics.mean(freshness_scores) if freshness_scores else 0
+        timestamps = [ts for ts in self._scraped_ts if ts is not None]
+        if not timestamps:
+            return 0
+        
+        # Fresher data gets higher scores (exponential decay, half-life of 1 week)
+        now_ts = datetime.now().timestamp()
+        decay = -1 / (168 * 3600)
+        return math.fsum(math.exp((now_ts - ts) * decay) for ts in timestamps) / len(timestamps)
     
     def _identify_premium_salary_patterns(self) -> Dict[str, Any]:
         """Identify patterns that indicate premium compensation"""
         premium_indicators = []
         
-        for job in self.jobs_data:
-            salary_text = str(job.get('salary') or '').lower()
-            overview = job.get('job_overview') or ''
-            title = job.get('title') or ''
-            job_text = f"{overview} {title}".lower()
-            
-            # Premium indicators
-            premium_signals = 0
-            
-            # Salary range indicators
-            if any(term in salary_text for term in ['competitive', 'excellent', 'attractive']):
-                premium_signals += 1
-            
-            # Monthly vs hourly premium
-            if 'per month' in salary_text or 'monthly' in salary_text:
-                premium_signals += 1
+        for job, salary_text, job_text in zip(self.jobs_data, self._salary_lower, self._job_text_lower):
+            # Salary range indicators, monthly vs hourly premium and
+            # performance bonus mentions
+            premium_signals = (
+                bool(_PREMIUM_SALARY_RE.search(salary_text))
+                + bool(_MONTHLY_SALARY_RE.search(salary_text))
+                + bool(_INCENTIVE_RE.search(job_text))
+            )
             
-            # Performance bonus mentions
-            if any(term in job_text for term in ['bonus', 'incentive', 'commission', 'performance']):
-                premium_signals += 1
-            
-            # Long-term commitment indicators
-            if any(term in job_text for term in ['long-term', 'career', 'growth', 'advancement']):
+            # Long-term commitment indicators; skipped when they could not
+            # lift the job to the premium threshold on their own
+            if premium_signals and _LONG_TERM_RE.search(job_text):
                 premium_signals += 1
             
             if premium_signals >= 2:
@@ -550,29 +803,16 @@ class JobMarketInsightsEngine:
         return {
             "premium_job_count": len(premium_indicators),
             "premium_percentage": len(premium_indicators) / len(self.jobs_data) * 100,
-            "top_premium_jobs": sorted(premium_indicators, key=lambda x: x['premium_score'], reverse=True)[:20]
+            "top_premium_jobs": heapq.nlargest(20, premium_indicators, key=itemgetter('premium_score'))
         }
     
-    def _identify_salary_arbitrage(self) -> List[Dict[str, Any]]:
-        """Identify salary arbitrage opportunities"""
-        # This would involve complex analysis of skill-to-salary ratios
-        # For now, return a placeholder structure
-        return [
-            {
-                "opportunity_type": "Undervalued Technical Skills",
-                "description": "AI/automation skills underpriced by ~40%",
-                "potential_upside": "2-3x current market rates",
-                "confidence_score": 0.85
-            }
-        ]
-    
     def _infer_employer_id(self, job: Dict[str, Any]) -> str:
         """Infer employer identity from job posting patterns"""
         # Simple heuristic based on URL patterns, could be enhanced
         url = job.get('url', '')
         if url:
             # Extract potential employer identifier from URL
-            match = re.search(r'/job/([^-]*)', url)
+            match = _EMPLOYER_URL_RE.search(url)
             if match:
                 return match.group(1)[:10]  # First 10 chars as ID
         
@@ -591,6 +831,13 @@ class JobMarketInsightsEngine:
         print("Starting comprehensive market analysis...")
         print("=" * 60)
         
+        # Reuse a previous analysis when the job files are unchanged
+        cache_path = None
+        if self.cache_dir:
+            cache_path = os.path.join(self.cache_dir, f"insights_{self._jobs_signature()}.json")
+            if self._load_cached_insights(cache_path):
+                return
+        
         # Load data
         self.load_jobs_data()
         
@@ -598,17 +845,27 @@ class JobMarketInsightsEngine:
             print("No job data found. Please ensure job files exist in the jobs directory.")
             return
         
-        # Run all analysis modules
-        self.insights["data_summary"] = self.analyze_basic_metrics()
-        self.insights["market_intelligence"] = {
-            "salary_patterns": self.analyze_salary_patterns(),
-            "skills_market": self.analyze_skills_market()
-        }
-        self.insights["competitive_landscape"] = self.analyze_competitive_landscape()
-        self.insights["temporal_patterns"] = self.analyze_temporal_patterns()
-        self.insights["opportunity_matrix"] = self.identify_opportunities()
-        self.insights["success_indicators"] = self.calculate_success_indicators()
-        self.insights["strategic_insights"] = self.generate_strategic_recommendations()
+        # Derive shared per-job values once for all analyzers
+        self._precompute()
+        
+        # Run the enabled analysis modules
+        enabled = self.enabled_sections
+        if "data_summary" in enabled:
+            self.insights["data_summary"] = self.analyze_basic_metrics()
+        if "salary_patterns" in enabled:
+            self.insights["market_intelligence"]["salary_patterns"] = self.analyze_salary_patterns()
+        if "skills_market" in enabled:
+            self.insights["market_intelligence"]["skills_market"] = self.analyze_skills_market()
+        if "competitive_landscape" in enabled:
+            self.insights["competitive_landscape"] = self.analyze_competitive_landscape()
+        if "temporal_patterns" in enabled:
+            self.insights["temporal_patterns"] = self.analyze_temporal_patterns()
+        if "opportunity_matrix" in enabled:
+            self.insights["opportunity_matrix"] = self.identify_opportunities()
+        if "success_indicators" in enabled:
+            self.insights["success_indicators"] = self.calculate_success_indicators()
+        if "strategic_insights" in enabled:
+            self.insights["strategic_insights"] = self.generate_strategic_recommendations()
         
         # Add metadata
         self.insights["analysis_metadata"] = {
@@ -618,6 +875,9 @@ class JobMarketInsightsEngine:
             "data_quality_score": self._assess_data_quality()
         }
         
+        if cache_path:
+            self._write_cached_insights(cache_path)
+        
         print("Analysis complete!")
         print("=" * 60)
     
@@ -627,12 +887,11 @@ class JobMarketInsightsEngine:
         data_size_score = min(len(self.jobs_data) / 1000, 1.0)  # Max at 1000 jobs
         
         # Check for data completeness
-        complete_jobs = sum(1 for job in self.jobs_data if all([
-            job.get('title'),
-            job.get('salary'),
-            job.get('job_overview'),
-            job.get('skill_requirements')
-        ]))
+        complete_jobs = sum(
+            1 for title, salary, overview, skills
+            in zip(self._titles, self._salaries, self._overviews, self._skills)
+            if title and salary and overview and skills
+        )
         
         completeness_score = complete_jobs / len(self.jobs_data) if self.jobs_data else 0
         
@@ -645,25 +904,25 @@ class JobMarketInsightsEngine:
         
         quality_indicators = []
         
-        for job in self.jobs_data:
+        for job, title, salary, overview, skills in zip(
+            self.jobs_data, self._titles, self._salaries, self._overviews, self._skills
+        ):
             score = 0
             
             # Check for required fields
-            if job.get('title'): score += 1
-            if job.get('salary'): score += 1
-            if job.get('job_overview'): score += 1
-            if job.get('skill_requirements'): score += 1
+            if title: score += 1
+            if salary: score += 1
+            if overview: score += 1
+            if skills: score += 1
             if job.get('is_active') is not None: score += 1
             
             # Check for rich data
-            overview = job.get('job_overview') or ''
-            skills = job.get('skill_requirements') or []
             if len(overview) > 100: score += 1
             if len(skills) > 0: score += 1
             
             quality_indicators.append(score / 7)  # Normalize to 0-1
         
-        return statistics.mean(quality_indicators)
+        return math.fsum(quality_indicators) / len(quality_indicators)
     
     def save_insights(self, output_file: str = "stats.json") -> None:
         """Save comprehensive insights to JSON file"""
@@ -672,7 +931,7 @@ class JobMarketInsightsEngine:
         # Add summary statistics for quick reference
         summary = {
             "executive_summary": {
-                "total_jobs_analyzed": len(self.jobs_data),
+                "total_jobs_analyzed": self.insights.get("analysis_metadata", {}).get("total_jobs_analyzed", 0),
                 "active_job_percentage": self.insights.get("data_summary", {}).get("activity_rate", 0) * 100,
                 "top_opportunity": "Multi-posting employers (55.6% of employers post multiple jobs)",
                 "key_insight": "47.9% of jobs show negotiation flexibility",
@@ -685,8 +944,11 @@ class JobMarketInsightsEngine:
         final_insights = {**summary, **self.insights}
         
         try:
+            # Encode fully before opening the file so it is written in one call
+            # and a serialization error cannot leave a truncated file behind
+            payload = json.dumps(final_insights, indent=2, ensure_ascii=False, default=_json_default)
             with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(final_insights, f, indent=2, ensure_ascii=False)
+                f.write(payload)
             print(f"✅ Insights successfully saved to {output_file}")
             print(f"📊 Analysis includes {len(self.insights)} major insight categories")
             print(f"🎯 Confidence score: {final_insights['analysis_metadata']['confidence_score']:.1%}")
@@ -696,91 +958,69 @@ class JobMarketInsightsEngine:
     # Placeholder implementations for remaining methods
     # These would be fully implemented in production
     
-    def _calculate_skill_saturation(self, skill_frequency: Counter) -> Dict[str, float]:
-        """Calculate market saturation for each skill"""
-        # Placeholder implementation
-        return {skill: min(count / 100, 1.0) for skill, count in skill_frequency.most_common(20)}
-    
-    def _analyze_skill_trends(self) -> Dict[str, List[str]]:
-        """Analyze emerging vs declining skills"""
-        # Placeholder - would analyze temporal data
-        return {
-            "emerging": ["AI Tools", "Automation", "No-Code Platforms"],
-            "declining": ["Basic Data Entry", "Simple Copy-Paste Tasks"]
-        }
-    
-    def _identify_premium_skills(self) -> List[Dict[str, Any]]:
-        """Identify skills that command premium rates"""
-        # Placeholder implementation
-        return [
-            {"skill": "Facebook Ads", "premium_multiplier": 2.3, "confidence": 0.9},
-            {"skill": "Google Ads", "premium_multiplier": 2.1, "confidence": 0.85}
-        ]
+    def _calculate_skill_saturation(self, skill_frequency: Counter, limit: Optional[int] = 20,
+                                    ranked_skills: Optional[List[Tuple[str, int]]] = None) -> Dict[str, float]:
+        """Calculate market saturation for the top skills (all skills if limit is None)"""
+        # Reuse a caller's most_common() ranking when it already covers the top `limit`
+        if (ranked_skills is not None and limit is not None
+                and (len(ranked_skills) >= limit or len(ranked_skills) == len(skill_frequency))):
+            top = ranked_skills[:limit]
+        else:
+            top = skill_frequency.most_common(limit)
+        
+        # Placeholder implementation: saturation is the posting count clipped at 100
+        return {skill: min(count, 100) / 100 for skill, count in top}
     
-    # Add all other placeholder methods...
-    def _identify_skill_gaps(self) -> List[str]: return ["AI Implementation", "Process Automation"]
-    def _identify_specialization_opportunities(self) -> List[str]: return ["HRTech", "PropTech", "FinTech"]
-    def _analyze_employer_quality(self) -> Dict: return {"high_quality_percentage": 34.5}
-    def _analyze_communication_patterns(self) -> Dict: return {"sophisticated_communication": 42.1}
-    def _analyze_urgency_patterns(self) -> Dict: return {"genuine_urgency": 41.7, "fake_urgency": 8.2}
-    def _identify_red_flags(self) -> List[str]: return ["Excessive urgency", "Vague compensation"]
-    def _identify_green_flags(self) -> List[str]: return ["Detailed job descriptions", "Clear processes"]
-    def _calculate_lifecycle_metrics(self, status_changes: List) -> Dict: return {"average_job_lifespan": "14 days"}
-    def _analyze_posting_timing(self, posting_patterns: List) -> Dict: return {"optimal_hour": 11, "optimal_day": "Monday"}
-    def _calculate_market_velocity(self) -> Dict: return {"posting_velocity": "high", "competition_velocity": "medium"}
-    def _analyze_status_patterns(self, status_changes: List) -> Dict: return {"status_change_frequency": 0.15}
-    def _identify_temporal_opportunities(self) -> List: return ["Off-peak application timing"]
-    def _calculate_skill_competition(self) -> Dict: return {"high_competition": ["VA", "Data Entry"], "low_competition": ["AI Tools"]}
-    def _identify_positioning_opportunities(self) -> List: return ["Technical specialization", "Industry focus"]
-    def _identify_blue_ocean_opportunities(self) -> List: return ["No-code development", "AI implementation"]
-    def _generate_competition_avoidance_strategies(self) -> List: return ["Skill stacking", "Niche specialization"]
-    def _generate_market_entry_strategies(self) -> List: return ["Start with multi-posters", "Target premium segments"]
-    def _categorize_employer_sophistication(self) -> Dict: return {"tier_1": 23.1, "tier_2": 54.2, "tier_3": 22.7}
-    def _analyze_cultural_expectations(self) -> Dict: return {"US_preference": 57.0, "formal_communication": 34.2}
-    def _identify_attention_tests(self) -> Dict: return {"attention_test_percentage": 23.4}
-    def _analyze_value_propositions(self) -> Dict: return {"growth_focused": 28.1, "stability_focused": 45.2}
-    def _identify_psychological_leverage(self) -> List: return ["Proactive communication", "Results focus"]
-    def _identify_skill_arbitrage(self) -> List: return ["AI skills undervalued", "Technical automation"]
-    def _identify_industry_opportunities(self) -> List: return ["HRTech explosion", "PropTech growth"]
-    def _identify_technology_opportunities(self) -> List: return ["Early AI adoption", "No-code platforms"]
-    def _identify_geographic_arbitrage(self) -> List: return ["US timezone premium", "Regional specialization"]
-    def _map_career_pathways(self) -> List: return ["VA → Specialist → Manager", "Technical → Strategic"]
-    def _identify_first_mover_advantages(self) -> List: return ["AI tool mastery", "Web3 positioning"]
-    def _calculate_job_quality_scores(self) -> Dict: return {"high_quality": 34.5, "medium_quality": 42.1, "low_quality": 23.4}
-    def _calculate_success_probabilities(self) -> Dict: return {"application_success_factors": ["attention_to_detail", "specialization"]}
-    def _generate_application_insights(self) -> Dict: return {"optimal_timing": "9-11 AM", "key_factors": ["customization", "portfolio"]}
-    def _create_quality_competition_matrix(self) -> Dict: return {"sweet_spot": "medium_quality_low_competition"}
-    def _generate_immediate_actions(self) -> List: return ["Target multi-posters", "Always negotiate", "Off-peak applications"]
-    def _generate_medium_term_strategies(self) -> List: return ["Skill stacking", "Industry specialization", "Portfolio building"]
-    def _generate_long_term_positioning(self) -> List: return ["Thought leadership", "Consulting transition", "Team building"]
-    def _generate_experience_based_strategies(self) -> Dict: return {"beginners": ["skill_focus"], "experienced": ["specialization"], "experts": ["positioning"]}
-    def _generate_leveling_tactics(self) -> List: return ["Negotiation training", "Market intelligence", "Strategic positioning"]
+    # Placeholders that will consume the collected status/posting data
+    def _calculate_lifecycle_metrics(self, status_changes: List) -> Mapping[str, Any]: return self._ph.lifecycle_metrics
+    def _analyze_posting_timing(self, posting_patterns: List) -> Mapping[str, Any]: return self._ph.posting_timing
+    def _analyze_status_patterns(self, status_changes: List) -> Mapping[str, Any]: return self._ph.status_patterns
+
+
+_BANNER_LINES = (
+    "🚀 OnlineJobs.ph Market Intelligence Engine",
+    "🎯 Mission: Level the playing field for job seekers",
+    "=" * 60
+)
+
+_EPILOG_LINES = (
+    "\n✨ Analysis complete! Use the insights to:",
+    "   📈 Identify high-opportunity niches",
+    "   💰 Maximize earning potential",
+    "   🎯 Reduce competition through strategic positioning",
+    "   🚀 Build competitive advantages",
+    "\n🔥 Level the playing field and dominate your market!"
+)
 
 
 def main():
     """Main entry point for the insights engine"""
+    import argparse
+    
     parser = argparse.ArgumentParser(description='OnlineJobs.ph Market Intelligence Engine')
     parser.add_argument('--jobs-dir', default='jobs', help='Directory containing job JSON files')
     parser.add_argument('--output', default='stats.json', help='Output file for insights')
+    parser.add_argument('--cache-dir', help='Reuse analyses of unchanged job data stored in this directory')
+    parser.add_argument('--sections', help=f"Comma-separated sections to compute (default: all of {','.join(ANALYSIS_SECTIONS)})")
     parser.add_argument('--verbose', action='store_true', help='Verbose output')
     
     args = parser.parse_args()
     
-    print("🚀 OnlineJobs.ph Market Intelligence Engine")
-    print("🎯 Mission: Level the playing field for job seekers")
-    print("=" * 60)
+    sections = None
+    if args.sections:
+        sections = [section.strip() for section in args.sections.split(',') if section.strip()]
+        unknown = set(sections) - set(ANALYSIS_SECTIONS)
+        if unknown:
+            parser.error(f"unknown sections: {', '.join(sorted(unknown))}")
+    
+    sys.stdout.write("\n".join(_BANNER_LINES) + "\n")
     
     # Initialize and run analysis
-    engine = JobMarketInsightsEngine(args.jobs_dir)
+    engine = JobMarketInsightsEngine(args.jobs_dir, cache_dir=args.cache_dir, enabled_sections=sections)
     engine.run_full_analysis()
     engine.save_insights(args.output)
     
-    print("\n✨ Analysis complete! Use the insights to:")
-    print("   📈 Identify high-opportunity niches")
-    print("   💰 Maximize earning potential")
-    print("   🎯 Reduce competition through strategic positioning")
-    print("   🚀 Build competitive advantages")
-    print("\n🔥 Level the playing field and dominate your market!")
+    sys.stdout.write("\n".join(_EPILOG_LINES) + "\n")
 
 
 if __name__ == "__main__":
@@ -1,76 +1,195 @@
+import gzip
+import hashlib
 import json
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import time
 import os
 import re
 from datetime import datetime
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Union
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 from urllib.parse import urljoin, urlparse
 import sys
+from scraper_common import RateLimiter, create_session
+
+# Prefer the C-backed lxml parser; fall back to the stdlib parser if it is missing
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    _HTML_PARSER = 'lxml'
+    _JOB_LINK_XPATH = etree.XPath('//a[contains(@href, "/jobseekers/job/")]/@href', smart_strings=False)
+except ImportError:
+    lxml_html = None
+    _HTML_PARSER = 'html.parser'
+
+# Labelled fields in the job page text, matched in one scan. Each group is
+# named after its job_data key; the value sits in a lookahead so only the
+# label is consumed and a label later on the same line is still found. The
+# value is taken from the rest of the label's line or the line after it, never
+# from further down the page.
+_JOB_FIELDS_RE = re.compile(
+    r'TYPE OF WORK(?=[ \t]*\n?[ \t]*(?P<type_of_work>\S[^\n]*))'
+    r'|SALARY(?=[ \t]*\n?[ \t]*(?P<salary>\S[^\n]*))'
+    r'|HOURS PER WEEK(?=[ \t]*\n?[ \t]*(?P<hours_per_week>\S[^\n]*))'
+    r'|DATE UPDATED(?=[ \t]*\n?[ \t]*(?P<date_updated>\S[^\n]*))',
+    re.IGNORECASE
+)
+_JOB_FIELD_COUNT = len(_JOB_FIELDS_RE.groupindex)
+_JOB_OVERVIEW_RE = re.compile(r'JOB OVERVIEW\s*(.*?)(?=SKILL REQUIREMENT|ABOUT THE EMPLOYER|$)', re.IGNORECASE | re.DOTALL)
+
+# Skill requirement parsing
+_SKILL_HEADING_RE = re.compile(r'SKILL\s+REQUIREMENT', re.IGNORECASE)
+_SKILL_SPLIT_RE = re.compile(r'[,\n\r]+|(?<=[a-z])(?=[A-Z][a-z])')
+_SKILL_SECTION_RE = re.compile(r'SKILL\s+REQUIREMENT[S]?\s*(.*?)(?=ABOUT\s+THE\s+EMPLOYER|SHARE\s+THIS\s+POST|VIEW\s+OTHER|$)', re.IGNORECASE | re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
+_SKILL_SECTION_END_RE = re.compile(r'(?:ABOUT THE EMPLOYER|SHARE THIS POST|VIEW OTHER|Employers|Workers|Copyright)', re.IGNORECASE)
+_SKILL_DELIMITER_RE = re.compile(r'[,\n\r]+')
+_SKILL_SECTION_STOPS = ('ABOUT THE EMPLOYER', 'SHARE THIS POST', 'VIEW OTHER JOB', 'COPYRIGHT')
+
+# Only build BeautifulSoup objects for what the scraper reads. Strainers filter
+# top-level elements only, so rejecting <html>/<head> descends into them while
+# scripts, styles and metadata outside <body> are never turned into objects.
+_JOB_PAGE_STRAINER = SoupStrainer(re.compile(r'^(?!(?:html|head|script|style|noscript|meta|link)$)'))
+_JOB_LINK_STRAINER = SoupStrainer('a', href=True)
+
+# Pages larger than this are truncated rather than buffered in full
+_MAX_PAGE_BYTES = 2_000_000
+
+_TOTAL_JOBS_RE = re.compile(r'Displaying\s+\d+\s+out\s+of\s+(\d+)\+?\s+jobs', re.IGNORECASE)
 
 
 class JobPostingScraper:
-    def __init__(self, max_workers: int = None, output_dir: str = "jobs"):
+    def __init__(self, max_workers: int = None, output_dir: str = "jobs", compress_output: bool = False):
         self.base_url = "https://www.onlinejobs.ph/jobseekers/jobsearch"
         self.job_base_url = "https://www.onlinejobs.ph/jobseekers/job/"
         self.output_dir = output_dir
-        self.max_workers = max_workers or os.cpu_count() or 4
-        self.results_lock = threading.Lock()
+        # Write job files as gzip-compressed .json.gz instead of plain .json
+        self.compress_output = compress_output
+        # Workers spend nearly all their time waiting on the network, so size the
+        # pool like the stdlib's I/O-bound default rather than one per core
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
         self.progress_lock = threading.Lock()
         self.completed_count = 0
         self.total_count = 0
         self.scraped_jobs = set()
         self.failed_jobs = []
+        # Status and cache validators of previously saved jobs, keyed by job ID;
+        # None until run() indexes the output directory
+        self._prior_state = None
         
         # Ensure output directory exists
         os.makedirs(output_dir, exist_ok=True)
         
+        # One session per worker thread, reused for every request that thread makes
+        self._thread_local = threading.local()
+        
     def _get_session(self):
-        """Create a new session for each thread"""
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        """Return this thread's session, creating it on first use"""
+        session = getattr(self._thread_local, 'session', None)
+        if session is None:
+            session = self._create_session()
+            self._thread_local.session = session
         return session
     
-    def extract_job_urls_from_page(self, html: str, base_url: str) -> List[str]:
+    def _create_session(self):
+        """Create a keep-alive session with retries for transient errors"""
+        return create_session()
+    
+    def _fetch_page(self, session: requests.Session, url: str, headers: Dict[str, str] = None) -> Tuple[Optional[bytes], Optional[str], Dict[str, str]]:
+        """Fetch a page body, reading at most _MAX_PAGE_BYTES of the (decompressed) content.
+        
+        Returns the raw bytes (None for 304 Not Modified), the declared encoding and
+        the cache validators. The bytes go straight to the parser, which decodes them
+        itself, so no separate str copy of the page is made.
+        """
+        with session.get(url, timeout=15, stream=True, headers=headers) as response:
+            response.raise_for_status()
+            
+            validators = {}
+            if response.headers.get('ETag'):
+                validators["etag"] = response.headers['ETag']
+            if response.headers.get('Last-Modified'):
+                validators["last_modified"] = response.headers['Last-Modified']
+            
+            if response.status_code == 304:
+                return None, response.encoding, validators
+            
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                body += chunk
+                if len(body) >= _MAX_PAGE_BYTES:
+                    del body[_MAX_PAGE_BYTES:]
+                    break
+            
+            return bytes(body), response.encoding, validators
+    
+    def extract_job_urls_from_page(self, html: Union[str, bytes], base_url: str) -> List[str]:
         """Extract all job URLs from a search results page"""
-        soup = BeautifulSoup(html, 'html.parser')
-        
+        return list(self._extract_job_urls_by_id(html, base_url).values())
+    
+    def _extract_job_urls_by_id(self, html: Union[str, bytes], base_url: str) -> Dict[str, str]:
+        """Map each job ID on a search results page to its preferred URL"""
         # Find all job links - there are usually 2 per job (descriptive + ID-only)
-        job_links = soup.select('a[href*="/jobseekers/job/"]')
+        job_hrefs = self._extract_job_hrefs(html)
         
         # Use a dict to track unique job IDs and prefer descriptive URLs
         job_urls_by_id = {}
         
-        for link in job_links:
-            href = link.get('href')
+        for href in job_hrefs:
             if href and '/jobseekers/job/' in href:
                 full_url = urljoin(base_url, href)
                 job_id = self.extract_job_id_from_url(full_url)
                 
                 if job_id:
-                    # Prefer longer, more descriptive URLs over short ID-only ones
-                    if job_id not in job_urls_by_id or len(full_url) > len(job_urls_by_id[job_id]):
-                        job_urls_by_id[job_id] = full_url
+                    self._merge_job_url(job_urls_by_id, job_id, full_url)
         
-        return list(job_urls_by_id.values())
+        return job_urls_by_id
+    
+    def _merge_job_url(self, job_urls_by_id: Dict[str, str], job_id: str, job_url: str) -> bool:
+        """Record a job URL, preferring longer, more descriptive URLs over short ID-only ones"""
+        current_url = job_urls_by_id.get(job_id)
+        if current_url is None or len(job_url) > len(current_url):
+            job_urls_by_id[job_id] = job_url
+        return current_url is None
+    
+    def _extract_job_hrefs(self, html: Union[str, bytes]) -> List[str]:
+        """Collect the href of every job link on a page"""
+        if lxml_html is not None:
+            # Only links are needed, so skip the BeautifulSoup tree entirely
+            try:
+                return _JOB_LINK_XPATH(lxml_html.fromstring(html))
+            except (etree.ParserError, ValueError):
+                pass
+        
+        # Plain find_all with an inline substring check avoids soupsieve's selector machinery
+        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_JOB_LINK_STRAINER)
+        return [
+            link['href'] for link in soup.find_all('a', href=True)
+            if '/jobseekers/job/' in link['href']
+        ]
     
     def extract_job_id_from_url(self, url: str) -> Optional[str]:
         """Extract job ID from job URL"""
         # Pattern: https://www.onlinejobs.ph/jobseekers/job/Facebook-Media-Buyer-Campaign-Launcher-1422402
-        # Extract the number at the end
-        match = re.search(r'/job/.*?-(\d+)/?$', url)
-        if match:
-            return match.group(1)
+        # Extract the number at the end (ignoring one trailing slash)
+        path = url[:-1] if url.endswith('/') else url
+        prefix = path.rstrip('0123456789')
+        job_id = path[len(prefix):]
+        if not job_id:
+            return None
+        
+        # Descriptive slug: the number follows a dash somewhere after /job/
+        if prefix.endswith('-'):
+            marker = prefix.find('/job/')
+            if marker != -1 and marker + 5 < len(prefix):
+                return job_id
+            return None
         
         # Alternative pattern: direct job ID
-        match = re.search(r'/job/(\d+)/?$', url)
-        if match:
-            return match.group(1)
+        if prefix.endswith('/job/'):
+            return job_id
         
         return None
     
@@ -83,11 +202,30 @@ class JobPostingScraper:
         if not job_id:
             return {"error": "Could not extract job ID from URL", "url": job_url}
         
+        # Revalidate against the previous scrape so unchanged pages come back as 304
+        prior_state = self._get_prior_state(job_id)
+        conditional_headers = {}
+        if prior_state:
+            if prior_state.get("etag"):
+                conditional_headers['If-None-Match'] = prior_state["etag"]
+            if prior_state.get("last_modified"):
+                conditional_headers['If-Modified-Since'] = prior_state["last_modified"]
+        
         try:
-            response = session.get(job_url, timeout=15)
-            response.raise_for_status()
+            content, encoding, validators = self._fetch_page(session, job_url, headers=conditional_headers or None)
+            
+            if content is None:
+                # Not modified - reuse the previous scrape
+                existing_data = self._load_existing_job(job_id)
+                if existing_data is None:
+                    # Saved file vanished since it was indexed; fetch the page in full
+                    content, encoding, validators = self._fetch_page(session, job_url)
+                else:
+                    existing_data["scraped_at"] = datetime.now().isoformat()
+                    existing_data.update(validators)
+                    return existing_data
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(content, _HTML_PARSER, from_encoding=encoding, parse_only=_JOB_PAGE_STRAINER)
             
             # Initialize job data
             job_data = {
@@ -104,6 +242,7 @@ class JobPostingScraper:
                 "is_active": True,
                 "status_history": []
             }
+            job_data.update(validators)
             
             # Extract job title
             title_selectors = ['h1', '.job-title', '#job-title', 'title']
@@ -126,62 +265,61 @@ class JobPostingScraper:
                 })
                 return job_data
             
-            # Extract structured data
-            text_content = soup.get_text()
-            
-            # Type of work
-            type_match = re.search(r'TYPE OF WORK\s*([^\n]+)', text_content, re.IGNORECASE)
-            if type_match:
-                job_data["type_of_work"] = type_match.group(1).strip()
-            
-            # Salary
-            salary_match = re.search(r'SALARY\s*([^\n]+)', text_content, re.IGNORECASE)
-            if salary_match:
-                job_data["salary"] = salary_match.group(1).strip()
+            # Extract structured data from the page body, leaving out the headings that
+            # repeat the job title; titles like "... - High Salary" would otherwise be
+            # read as the salary field
+            content_root = soup.body or soup
+            for heading in content_root.find_all('h1'):
+                heading.decompose()
+            text_content = content_root.get_text()
             
-            # Hours per week
-            hours_match = re.search(r'HOURS PER WEEK\s*([^\n]+)', text_content, re.IGNORECASE)
-            if hours_match:
-                job_data["hours_per_week"] = hours_match.group(1).strip()
-            
-            # Date updated
-            date_match = re.search(r'DATE UPDATED\s*([^\n]+)', text_content, re.IGNORECASE)
-            if date_match:
-                job_data["date_updated"] = date_match.group(1).strip()
+            # Type of work, salary, hours per week and date updated - first occurrence of each
+            found_fields = set()
+            for field_match in _JOB_FIELDS_RE.finditer(text_content):
+                field = field_match.lastgroup
+                if field not in found_fields:
+                    found_fields.add(field)
+                    job_data[field] = field_match.group(field).strip()
+                    if len(found_fields) == _JOB_FIELD_COUNT:
+                        break
             
             # Job overview
-            overview_match = re.search(r'JOB OVERVIEW\s*(.*?)(?=SKILL REQUIREMENT|ABOUT THE EMPLOYER|$)', text_content, re.IGNORECASE | re.DOTALL)
+            overview_match = _JOB_OVERVIEW_RE.search(text_content)
             if overview_match:
                 job_data["job_overview"] = overview_match.group(1).strip()
             
             # Skill requirements - improved parsing
             # Try to find skills in structured HTML first - look for skill links
             skill_links = soup.find_all('a', {'class': 'card-worker-topskill'})
+            # Both fallbacks need the heading, so a quick scan of the text already in hand
+            # rules them out before walking every string in the tree
+            has_skill_heading = _SKILL_HEADING_RE.search(text_content) is not None
             if skill_links:
                 job_data["skill_requirements"] = [link.get_text(strip=True) for link in skill_links]
-            else:
+            elif has_skill_heading:
                 # Fallback: look for SKILL REQUIREMENT section
-                skills_section = soup.find(string=re.compile(r'SKILL\s+REQUIREMENT', re.IGNORECASE))
+                skills_section = soup.find(string=_SKILL_HEADING_RE)
                 if skills_section:
                     # Look for the parent element and find skills after it
                     parent = skills_section.parent
                     if parent:
                         # Find the next elements that contain the skills
-                        next_elements = parent.find_next_siblings()
-                        skills_text = ""
-                        for elem in next_elements:
+                        skill_parts = []
+                        for elem in parent.find_next_siblings():
                             elem_text = elem.get_text(strip=True)
                             # Stop if we hit other sections
-                            if any(section in elem_text.upper() for section in ['ABOUT THE EMPLOYER', 'SHARE THIS POST', 'VIEW OTHER JOB', 'COPYRIGHT']):
+                            elem_upper = elem_text.upper()
+                            if any(section in elem_upper for section in _SKILL_SECTION_STOPS):
                                 break
-                            if elem_text and len(elem_text) > 2:
-                                skills_text += elem_text + " "
+                            if len(elem_text) > 2:
+                                skill_parts.append(elem_text)
+                        skills_text = " ".join(skill_parts)
                         
                         if skills_text:
                             # Clean and split skills
                             skills_text = skills_text.strip()
                             # Split by common delimiters and camelCase boundaries
-                            skills = re.split(r'[,\n\r]+|(?<=[a-z])(?=[A-Z][a-z])', skills_text)
+                            skills = _SKILL_SPLIT_RE.split(skills_text)
                             job_data["skill_requirements"] = [
                                 skill.strip() 
                                 for skill in skills 
@@ -189,17 +327,17 @@ class JobPostingScraper:
                             ]
             
             # Fallback to text-based parsing if HTML parsing didn't work
-            if not job_data["skill_requirements"]:
-                skills_match = re.search(r'SKILL\s+REQUIREMENT[S]?\s*(.*?)(?=ABOUT\s+THE\s+EMPLOYER|SHARE\s+THIS\s+POST|VIEW\s+OTHER|$)', text_content, re.IGNORECASE | re.DOTALL)
+            if not job_data["skill_requirements"] and has_skill_heading:
+                skills_match = _SKILL_SECTION_RE.search(text_content)
                 if skills_match:
                     skills_text = skills_match.group(1).strip()
                     # Clean up the text and split
-                    skills_text = re.sub(r'\s+', ' ', skills_text)  # Normalize whitespace
+                    skills_text = _WHITESPACE_RE.sub(' ', skills_text)  # Normalize whitespace
                     # Stop at common footer/section markers
-                    skills_text = re.split(r'(?:ABOUT THE EMPLOYER|SHARE THIS POST|VIEW OTHER|Employers|Workers|Copyright)', skills_text, flags=re.IGNORECASE)[0]
+                    skills_text = _SKILL_SECTION_END_RE.split(skills_text, maxsplit=1)[0]
                     
                     # Split skills by common delimiters
-                    skills = re.split(r'[,\n\r]+', skills_text.strip())
+                    skills = _SKILL_DELIMITER_RE.split(skills_text.strip())
                     job_data["skill_requirements"] = [
                         skill.strip() 
                         for skill in skills 
@@ -218,34 +356,33 @@ class JobPostingScraper:
     def extract_total_jobs_from_page(self, html: str) -> int:
         """Extract total number of jobs from page text"""
         # Look for pattern like "Displaying 30 out of 954+ jobs"
-        match = re.search(r'Displaying\s+\d+\s+out\s+of\s+(\d+)\+?\s+jobs', html, re.IGNORECASE)
+        match = _TOTAL_JOBS_RE.search(html)
         if match:
             return int(match.group(1))
         return 0
     
-    def _fetch_page_worker(self, page_data: Tuple[int, str], delay: float) -> Tuple[int, List[str]]:
+    def _fetch_page_worker(self, page_data: Tuple[int, str], rate_limiter: RateLimiter) -> Tuple[int, Dict[str, str]]:
         """Worker function for parallel page fetching"""
         page_num, url = page_data
         session = self._get_session()
         
-        # Add small delay to avoid overwhelming the server
-        time.sleep(delay * (0.5 + 0.5 * threading.current_thread().ident % 10 / 10))
+        # Wait for a request slot to avoid overwhelming the server
+        rate_limiter.wait()
         
         try:
-            response = session.get(url, timeout=15)
-            response.raise_for_status()
+            content, _, _ = self._fetch_page(session, url)
             
-            job_urls = self.extract_job_urls_from_page(response.text, self.base_url)
+            job_urls_by_id = self._extract_job_urls_by_id(content, self.base_url)
             
             with self.progress_lock:
-                print(f"Page {page_num}: Found {len(job_urls)} job URLs")
+                print(f"Page {page_num}: Found {len(job_urls_by_id)} job URLs")
             
-            return page_num, job_urls
+            return page_num, job_urls_by_id
             
         except Exception as e:
             with self.progress_lock:
                 print(f"Error scraping page {page_num}: {str(e)}")
-            return page_num, []
+            return page_num, {}
     
     def get_job_urls_from_search_pages(self, max_pages: int = None, delay: float = 1.0) -> List[str]:
         """Get all job URLs by paginating through search results in parallel"""
@@ -255,11 +392,11 @@ class JobPostingScraper:
         session = self._get_session()
         try:
             print(f"Fetching first page to determine total jobs...")
-            response = session.get(self.base_url, timeout=15)
-            response.raise_for_status()
+            content, encoding, _ = self._fetch_page(session, self.base_url)
+            html = content.decode(encoding or 'utf-8', errors='replace')
             
             # Extract total jobs and calculate pages needed
-            total_jobs = self.extract_total_jobs_from_page(response.text)
+            total_jobs = self.extract_total_jobs_from_page(html)
             if total_jobs > 0:
                 # Each page has 30 jobs, so calculate total pages needed
                 total_pages = (total_jobs + 29) // 30  # Round up
@@ -269,7 +406,7 @@ class JobPostingScraper:
                 total_pages = 100  # Fallback
             
             # Get job URLs from first page
-            first_page_urls = self.extract_job_urls_from_page(response.text, self.base_url)
+            first_page_urls = self._extract_job_urls_by_id(content, self.base_url)
             print(f"Page 1: Found {len(first_page_urls)} job URLs")
             
         except Exception as e:
@@ -292,16 +429,21 @@ class JobPostingScraper:
             page_data.append((page_num, url))
         
         # Fetch remaining pages in parallel
-        all_job_urls = set(first_page_urls)
+        # Deduplicate across pages by job ID rather than by URL string
+        all_job_urls = first_page_urls
         
         if page_data:
             print(f"Fetching remaining {len(page_data)} pages in parallel...")
             start_time = time.time()
             
-            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(page_data))) as executor:
+            workers = min(self.max_workers, len(page_data))
+            # Same overall rate as each worker waiting `delay` between its own requests
+            rate_limiter = RateLimiter(workers / delay if delay > 0 else 0)
+            
+            with ThreadPoolExecutor(max_workers=workers) as executor:
                 # Submit all page fetching tasks
                 future_to_page = {
-                    executor.submit(self._fetch_page_worker, page_info, delay): page_info
+                    executor.submit(self._fetch_page_worker, page_info, rate_limiter): page_info
                     for page_info in page_data
                 }
                 
@@ -309,13 +451,12 @@ class JobPostingScraper:
                 for future in as_completed(future_to_page):
                     page_info = future_to_page[future]
                     try:
-                        page_num, job_urls = future.result()
+                        page_num, job_urls_by_id = future.result()
                         
                         # Add new URLs
                         new_urls = 0
-                        for job_url in job_urls:
-                            if job_url not in all_job_urls:
-                                all_job_urls.add(job_url)
+                        for job_id, job_url in job_urls_by_id.items():
+                            if self._merge_job_url(all_job_urls, job_id, job_url):
                                 new_urls += 1
                         
                     except Exception as e:
@@ -326,14 +467,14 @@ class JobPostingScraper:
             print(f"Parallel page fetching completed in {elapsed_time:.1f} seconds")
         
         print(f"Collected {len(all_job_urls)} unique job URLs")
-        return list(all_job_urls)
+        return list(all_job_urls.values())
     
-    def _scrape_job_worker(self, job_url: str, delay: float) -> Dict:
+    def _scrape_job_worker(self, job_url: str, rate_limiter: RateLimiter) -> Dict:
         """Worker function for parallel job scraping"""
         session = self._get_session()
         
-        # Add small random delay to avoid thundering herd
-        time.sleep(delay * (0.5 + 0.5 * threading.current_thread().ident % 10 / 10))
+        # Wait for a request slot; the shared bucket spreads workers out evenly
+        rate_limiter.wait()
         
         job_data = self.scrape_job_details(job_url, session)
         job_id = job_data.get("job_id", "unknown")
@@ -350,39 +491,114 @@ class JobPostingScraper:
         
         return job_data
     
-    def check_status_change(self, new_job_data: Dict, existing_filepath: str) -> Dict:
+    def _job_filepaths(self, job_id: str) -> Tuple[str, str]:
+        """Paths a job may be saved under: the current output format first, then the other"""
+        plain = os.path.join(self.output_dir, f"{job_id}.json")
+        compressed = plain + '.gz'
+        return (compressed, plain) if self.compress_output else (plain, compressed)
+    
+    def _load_existing_job(self, job_id: str) -> Optional[Dict]:
+        """Load the previously saved data for a job, if any"""
+        for filepath in self._job_filepaths(job_id):
+            try:
+                # json.loads decodes UTF-8 bytes itself, skipping the text-mode file layer
+                with (gzip.open(filepath, 'rb') if filepath.endswith('.gz') else open(filepath, 'rb')) as f:
+                    existing_data = json.loads(f.read())
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError, EOFError):
+                return None
+            return existing_data if isinstance(existing_data, dict) else None
+        return None
+    
+    def _extract_prior_state(self, job_data: Dict) -> Dict:
+        """Keep only the fields later scrapes need from a saved job"""
+        return {
+            "is_active": job_data.get("is_active", True),
+            "status_history": job_data.get("status_history", []),
+            "etag": job_data.get("etag"),
+            "last_modified": job_data.get("last_modified"),
+            "content_digest": self._job_content_digest(job_data)
+        }
+    
+    def _job_content_digest(self, job_data: Dict) -> str:
+        """Hash a job's saved fields apart from the scrape time"""
+        content = {key: value for key, value in job_data.items() if key != "scraped_at"}
+        payload = json.dumps(content, sort_keys=True, ensure_ascii=False)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _load_prior_state(self) -> Dict[str, Dict]:
+        """Read every saved job once and index its status and cache validators by job ID"""
+        with os.scandir(self.output_dir) as entries:
+            job_ids = list({
+                entry.name.split('.', 1)[0] for entry in entries
+                if entry.name.endswith(('.json', '.json.gz')) and entry.is_file()
+            })
+        
+        prior_state = {}
+        if not job_ids:
+            return prior_state
+        
+        # Hand each thread a batch of files rather than one future per file; the
+        # files are small, so per-task overhead would otherwise dominate
+        batch_size = -(-len(job_ids) // (self.max_workers * 4))
+        batches = [job_ids[i:i + batch_size] for i in range(0, len(job_ids), batch_size)]
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for batch_state in executor.map(self._load_prior_state_batch, batches):
+                prior_state.update(batch_state)
+        
+        return prior_state
+    
+    def _load_prior_state_batch(self, job_ids: List[str]) -> Dict[str, Dict]:
+        """Load the prior state for a batch of saved jobs"""
+        batch_state = {}
+        for job_id in job_ids:
+            job_data = self._load_existing_job(job_id)
+            if job_data and job_data.get("job_id"):
+                batch_state[job_id] = self._extract_prior_state(job_data)
+        return batch_state
+    
+    def _get_prior_state(self, job_id: str) -> Optional[Dict]:
+        """Look up a job's previous status, reading its file when no index has been loaded"""
+        if self._prior_state is not None:
+            return self._prior_state.get(job_id)
+        
+        existing_data = self._load_existing_job(job_id)
+        return self._extract_prior_state(existing_data) if existing_data else None
+    
+    def check_status_change(self, new_job_data: Dict, prior_state: Optional[Dict] = None) -> Dict:
         """Check if job status has changed and update history"""
-        try:
-            with open(existing_filepath, 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
-            
-            # Check if status changed from active to inactive
-            was_active = existing_data.get("is_active", True)
-            is_now_active = new_job_data.get("is_active", True)
-            
-            # Copy existing status history
-            new_job_data["status_history"] = existing_data.get("status_history", [])
-            
-            if was_active and not is_now_active:
-                # Job became inactive
-                new_job_data["status_history"].append({
-                    "status": "inactive",
-                    "timestamp": datetime.now().isoformat(),
-                    "reason": "Job became unavailable during re-scrape"
-                })
-                print(f"Job {new_job_data.get('job_id')} changed status: ACTIVE -> INACTIVE")
-            elif not was_active and is_now_active:
-                # Job became active again
-                new_job_data["status_history"].append({
-                    "status": "active",
-                    "timestamp": datetime.now().isoformat(),
-                    "reason": "Job became available again during re-scrape"
-                })
-                print(f"Job {new_job_data.get('job_id')} changed status: INACTIVE -> ACTIVE")
-            
-        except Exception as e:
-            # If we can't read existing file, just use new data as-is
-            pass
+        if prior_state is None:
+            prior_state = self._get_prior_state(new_job_data.get("job_id"))
+            if prior_state is None:
+                # Never saved before, so there is no status to compare against
+                return new_job_data
+        
+        # Check if status changed from active to inactive
+        was_active = prior_state.get("is_active", True)
+        is_now_active = new_job_data.get("is_active", True)
+        
+        # Copy existing status history; the prior-state index keeps its own
+        # list until the new data has been saved
+        new_job_data["status_history"] = list(prior_state.get("status_history", ()))
+        
+        if was_active and not is_now_active:
+            # Job became inactive
+            new_job_data["status_history"].append({
+                "status": "inactive",
+                "timestamp": datetime.now().isoformat(),
+                "reason": "Job became unavailable during re-scrape"
+            })
+            print(f"Job {new_job_data.get('job_id')} changed status: ACTIVE -> INACTIVE")
+        elif not was_active and is_now_active:
+            # Job became active again
+            new_job_data["status_history"].append({
+                "status": "active",
+                "timestamp": datetime.now().isoformat(),
+                "reason": "Job became available again during re-scrape"
+            })
+            print(f"Job {new_job_data.get('job_id')} changed status: INACTIVE -> ACTIVE")
         
         return new_job_data
 
@@ -392,12 +608,12 @@ class JobPostingScraper:
         if not job_id:
             return False
         
-        filename = f"{job_id}.json"
-        filepath = os.path.join(self.output_dir, filename)
+        filepath, stale_filepath = self._job_filepaths(job_id)
         
-        # Check for status changes if file already exists
-        if os.path.exists(filepath):
-            job_data = self.check_status_change(job_data, filepath)
+        # Check for status changes if the job was saved before
+        prior_state = self._get_prior_state(job_id)
+        if prior_state:
+            job_data = self.check_status_change(job_data, prior_state)
         else:
             # First time scraping this job, add initial status
             if job_data.get("is_active", True):
@@ -407,9 +623,31 @@ class JobPostingScraper:
                     "reason": "Job first discovered"
                 })
         
+        # Skip the write when nothing but the scrape time differs from the saved copy,
+        # which also means is_active and status_history are unchanged
+        if (prior_state and prior_state.get("content_digest") == self._job_content_digest(job_data)
+                and os.path.exists(filepath)):
+            return True
+        
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(job_data, f, indent=2, ensure_ascii=False)
+            # Serialize first so the file is written in a single call
+            payload = json.dumps(job_data, indent=2, ensure_ascii=False)
+            if self.compress_output:
+                # Level 1 shrinks the indented JSON most of the way at a fraction of the CPU
+                with gzip.open(filepath, 'wt', encoding='utf-8', compresslevel=1) as f:
+                    f.write(payload)
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+            
+            # Drop a copy left over from a run in the other format
+            try:
+                os.remove(stale_filepath)
+            except FileNotFoundError:
+                pass
+            
+            if self._prior_state is not None:
+                self._prior_state[job_id] = self._extract_prior_state(job_data)
             return True
         except Exception as e:
             print(f"Error saving job {job_id}: {str(e)}")
@@ -421,6 +659,10 @@ class JobPostingScraper:
         print(f"Output directory: {self.output_dir}")
         print(f"Max workers: {self.max_workers}")
         
+        # Index previously saved jobs once instead of re-reading each file per job
+        self._prior_state = self._load_prior_state()
+        print(f"Found {len(self._prior_state)} previously saved jobs")
+        
         # Step 1: Get all job URLs
         job_urls = self.get_job_urls_from_search_pages(max_pages=max_pages, delay=delay)
         
@@ -438,15 +680,20 @@ class JobPostingScraper:
         # Step 2: Scrape jobs in parallel
         start_time = time.time()
         successful_jobs = 0
+        inactive_jobs = 0
+        
+        # Same overall rate as each worker waiting `delay` between its own requests
+        rate_limiter = RateLimiter(self.max_workers / delay if delay > 0 else 0)
         
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # Submit all tasks
             future_to_url = {
-                executor.submit(self._scrape_job_worker, job_url, delay): job_url
+                executor.submit(self._scrape_job_worker, job_url, rate_limiter): job_url
                 for job_url in job_urls
             }
             
-            # Process completed tasks
+            # Process completed tasks; only this loop touches the results,
+            # so no lock is needed
             for future in as_completed(future_to_url):
                 job_url = future_to_url[future]
                 try:
@@ -455,41 +702,28 @@ class JobPostingScraper:
                     # Save job data (including inactive jobs)
                     if "error" not in job_data and self.save_job_data(job_data):
                         successful_jobs += 1
-                        with self.results_lock:
-                            self.scraped_jobs.add(job_data.get("job_id"))
+                        if not job_data.get("is_active", True):
+                            inactive_jobs += 1
+                        self.scraped_jobs.add(job_data.get("job_id"))
                     else:
-                        with self.results_lock:
-                            self.failed_jobs.append({
-                                "url": job_url,
-                                "error": job_data.get("error", "Unknown error"),
-                                "timestamp": datetime.now().isoformat()
-                            })
-                        
-                except Exception as e:
-                    print(f"Error processing {job_url}: {str(e)}")
-                    with self.results_lock:
                         self.failed_jobs.append({
                             "url": job_url,
-                            "error": f"Worker error: {str(e)}",
+                            "error": job_data.get("error", "Unknown error"),
                             "timestamp": datetime.now().isoformat()
                         })
+                        
+                except Exception as e:
+                    print(f"Error processing {job_url}: {str(e)}")
+                    self.failed_jobs.append({
+                        "url": job_url,
+                        "error": f"Worker error: {str(e)}",
+                        "timestamp": datetime.now().isoformat()
+                    })
         
         elapsed_time = time.time() - start_time
         print(f"\nScraping completed in {elapsed_time:.1f} seconds")
         print(f"Successful jobs: {successful_jobs}")
         
-        # Count inactive jobs from successful scrapes
-        inactive_jobs = 0
-        for job_id in self.scraped_jobs:
-            job_file = os.path.join(self.output_dir, f"{job_id}.json")
-            try:
-                with open(job_file, 'r', encoding='utf-8') as f:
-                    job_data = json.load(f)
-                    if not job_data.get("is_active", True):
-                        inactive_jobs += 1
-            except:
-                pass
-        
         active_jobs = successful_jobs - inactive_jobs
         error_jobs = len(self.failed_jobs)
         
@@ -511,11 +745,12 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='Scrape job postings from OnlineJobs.ph')
-    parser.add_argument('--workers', type=int, help='Number of parallel workers (default: CPU count)')
+    parser.add_argument('--workers', type=int, help='Number of parallel workers (default: CPU count + 4, max 32)')
     parser.add_argument('--delay', type=float, default=1.5, help='Delay between requests per worker (default: 1.5)')
     parser.add_argument('--max-pages', type=int, help='Maximum number of search pages to scrape')
     parser.add_argument('--limit-jobs', type=int, help='Limit number of jobs to scrape (for testing)')
     parser.add_argument('--output-dir', default='jobs', help='Output directory for job JSON files (default: jobs)')
+    parser.add_argument('--compress', action='store_true', help='Write job files gzip-compressed as .json.gz')
     parser.add_argument('--test', action='store_true', help='Test mode - scrape only first page and limit to 10 jobs')
     
     args = parser.parse_args()
@@ -528,7 +763,7 @@ def main():
         max_pages = args.max_pages
         limit_jobs = args.limit_jobs
     
-    scraper = JobPostingScraper(max_workers=args.workers, output_dir=args.output_dir)
+    scraper = JobPostingScraper(max_workers=args.workers, output_dir=args.output_dir, compress_output=args.compress)
     scraper.run(max_pages=max_pages, delay=args.delay, limit_jobs=limit_jobs)
 
 
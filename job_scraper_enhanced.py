@@ -1,17 +1,47 @@
 import json
 import requests
-from bs4 import BeautifulSoup
 import time
 import csv
 from datetime import datetime
 import re
-from typing import Dict, List, Tuple, Any
-import copy
+from typing import Dict, List, Tuple, Union, NamedTuple
+import heapq
+from operator import attrgetter
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 import os
-from queue import Queue
-import sys
+from scraper_common import RateLimiter, create_session
+
+# Job count markers: "Displaying X out of Y jobs" and the analytics data layer.
+# Both run on the raw response bytes; markup and (encoded) non-breaking spaces
+# between the words of the display pattern count as gaps.
+_GAP = rb'(?:\s|<[^>]*>|&nbsp;|&#160;|\xc2\xa0)*'
+_DISPLAY_RE = re.compile(
+    rb'Displaying' + _GAP + rb'(\d+)' + _GAP + rb'out' + _GAP + rb'of' + _GAP + rb'(\d+)' + _GAP + rb'jobs',
+    re.IGNORECASE
+)
+_DATALAYER_RE = re.compile(rb'"search_result_count":\s*(\d+)')
+
+# Streaming scan: bytes of the previous chunks re-scanned so a marker split across
+# chunks is still found, and the most of a page kept in memory
+_DISPLAY_SCAN_OVERLAP = 4096
+_MAX_PAGE_BYTES = 2_000_000
+
+# Print a progress line every this many completed skills (failures are always printed)
+_PROGRESS_EVERY = 50
+
+# Buffer size for the output files, so each is written in a few large chunks
+_WRITE_BUFFER = 1 << 20
+
+class ScrapeRow(NamedTuple):
+    """Result of scraping one skill; fields are in job_scrape_details_latest.csv column order"""
+    skill: str
+    path: str
+    skill_id: str
+    job_count: int
+    status: str
+    url: str
+    timestamp: str
 
 class OnlineJobsScraperEnhanced:
     def __init__(self, json_file: str, max_workers: int = None):
@@ -19,35 +49,40 @@ class OnlineJobsScraperEnhanced:
         self.base_url = "https://www.onlinejobs.ph/jobseekers/jobsearch?skill_tags="
         self.results = []
         self.enhanced_tree = {}
-        self.max_workers = max_workers or os.cpu_count() or 4
-        self.results_lock = threading.Lock()
-        self.progress_lock = threading.Lock()
+        # Workers spend nearly all their time waiting on the network, so size the
+        # pool like the stdlib's I/O-bound default rather than one per core
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
         self.completed_count = 0
         self.total_count = 0
+        # One session per worker thread, reused for every skill that thread scrapes
+        self._thread_local = threading.local()
         
     def _get_session(self):
-        """Create a new session for each thread"""
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        """Return this thread's session, creating it on first use"""
+        session = getattr(self._thread_local, 'session', None)
+        if session is None:
+            session = self._create_session()
+            self._thread_local.session = session
         return session
-        
-    def extract_job_count(self, html: str) -> int:
+    
+    def _create_session(self):
+        """Create a keep-alive session with retries for transient errors"""
+        return create_session()
+    
+    def extract_job_count(self, html: Union[str, bytes]) -> int:
         """Extract the number of jobs from the HTML page"""
-        soup = BeautifulSoup(html, 'html.parser')
+        if isinstance(html, str):
+            html = html.encode('utf-8')
         
-        # Primary pattern: "Displaying X out of Y jobs"
-        text = soup.get_text()
-        display_pattern = r'Displaying\s*(\d+)\s*out\s*of\s*(\d+)\s*jobs'
-        match = re.search(display_pattern, text, re.IGNORECASE)
+        # Primary pattern: "Displaying X out of Y jobs" - matched on the raw HTML,
+        # no need to build a parse tree just to read the page text
+        match = _DISPLAY_RE.search(html)
         if match:
             # Return the total count (second number)
             return int(match.group(2))
         
         # Try to find in data layer if available
-        datalayer_pattern = r'"search_result_count":\s*(\d+)'
-        match = re.search(datalayer_pattern, html)
+        match = _DATALAYER_RE.search(html)
         if match:
             return int(match.group(1))
         
@@ -55,95 +90,92 @@ class OnlineJobsScraperEnhanced:
     
     def scrape_job_count(self, skill_id: str, session: requests.Session = None) -> Tuple[int, str]:
         """Scrape the job count for a specific skill"""
-        url = f"{self.base_url}{skill_id}"
-        
+        return self._fetch_job_count(f"{self.base_url}{skill_id}", session)
+    
+    def _fetch_job_count(self, url: str, session: requests.Session = None) -> Tuple[int, str]:
+        """Fetch a skill search page and extract its job count"""
         if session is None:
             session = self._get_session()
         
         try:
-            response = session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            job_count = self.extract_job_count(response.text)
-            return job_count, "Success"
+            with session.get(url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                
+                # Match on the undecoded bytes as they arrive; the markers are ASCII, so
+                # there is no need to build response.text
+                body = bytearray()
+                chunks = response.iter_content(chunk_size=16 * 1024)
+                for chunk in chunks:
+                    scan_from = max(0, len(body) - _DISPLAY_SCAN_OVERLAP)
+                    body += chunk
+                    match = _DISPLAY_RE.search(body, scan_from)
+                    if match:
+                        # Drain without buffering so the connection can be kept alive
+                        for _ in chunks:
+                            pass
+                        return int(match.group(2)), "Success"
+                    if len(body) >= _MAX_PAGE_BYTES:
+                        break
+                
+                # No display marker - fall back to the data layer
+                job_count = self.extract_job_count(bytes(body))
+                return job_count, "Success"
             
         except requests.exceptions.RequestException as e:
             return 0, f"Error: {str(e)}"
         except Exception as e:
             return 0, f"Unexpected error: {str(e)}"
     
-    def _scrape_worker(self, skill_data: Tuple[str, str, str], delay: float) -> Dict:
+    def _scrape_worker(self, skill_data: Tuple[str, str, str], rate_limiter: RateLimiter) -> ScrapeRow:
         """Worker function for parallel scraping"""
         skill_name, skill_id, path = skill_data
         session = self._get_session()
         
-        # Add small random delay to avoid thundering herd
-        time.sleep(delay * (0.5 + 0.5 * threading.current_thread().ident % 10 / 10))
-        
-        job_count, status = self.scrape_job_count(skill_id, session)
-        
-        result = {
-            'skill': skill_name,
-            'path': path,
-            'skill_id': skill_id,
-            'job_count': job_count,
-            'status': status,
-            'url': f"{self.base_url}{skill_id}",
-            'timestamp': datetime.now().isoformat()
-        }
+        # Wait for a request slot; the shared bucket spreads workers out evenly
+        rate_limiter.wait()
         
-        # Update progress
-        with self.progress_lock:
-            self.completed_count += 1
-            print(f"Progress: {self.completed_count}/{self.total_count} - {skill_name}: {job_count} jobs ({status})")
+        # Build the search URL once for both the request and the result row
+        url = f"{self.base_url}{skill_id}"
+        job_count, status = self._fetch_job_count(url, session)
         
-        return result
+        return ScrapeRow(skill_name, path, skill_id, job_count, status, url, datetime.now().isoformat())
     
     def process_tree_with_counts(self, data: Dict, job_counts: Dict[str, int], path: str = "") -> Dict:
         """Process the tree and create an enhanced structure with job counts"""
-        result = {}
-        
-        for key, value in data.items():
-            current_path = f"{path} > {key}" if path else key
-            
-            if isinstance(value, str):
-                # Leaf node - add job count information
-                job_count = job_counts.get(value, 0)
-                result[key] = {
-                    "id": value,
-                    "job_count": job_count,
-                    "type": "leaf"
-                }
-            elif isinstance(value, dict):
-                # Branch node - recurse and calculate total jobs
-                child_data = self.process_tree_with_counts(value, job_counts, current_path)
-                total_jobs = sum(
-                    item.get("job_count", 0) if isinstance(item, dict) else 0
-                    for item in child_data.values()
-                )
-                total_jobs += sum(
-                    item.get("total_jobs", 0) if isinstance(item, dict) else 0
-                    for item in child_data.values()
-                )
-                
-                result[key] = {
-                    "children": child_data,
-                    "total_jobs": total_jobs,
-                    "type": "branch"
-                }
-        
+        leaf_refs = {}
+        result = self._find_leaf_nodes(data, [], path, leaf_refs)
+        self._fill_job_counts(result, leaf_refs, job_counts)
         return result
     
+    def _fill_job_counts(self, tree: Dict, leaf_refs: Dict[str, List[Dict]], job_counts: Dict[str, int]):
+        """Set the scraped counts on a skeleton tree's leaves and total its branches"""
+        for skill_id, job_count in job_counts.items():
+            for leaf in leaf_refs.get(skill_id, ()):
+                leaf["job_count"] = job_count
+        self._sum_branch_totals(tree)
+    
+    def _sum_branch_totals(self, tree: Dict) -> int:
+        """Fill in total_jobs for every branch of an enhanced tree and return the tree's total"""
+        total_jobs = 0
+        for node in tree.values():
+            if node["type"] == "leaf":
+                total_jobs += node["job_count"]
+            else:
+                node["total_jobs"] = self._sum_branch_totals(node["children"])
+                total_jobs += node["total_jobs"]
+        return total_jobs
+    
     def run(self, delay: float = 1.0, limit: int = None):
         """Run the scraper with parallel workers"""
         # Load JSON data
         print(f"Loading data from {self.json_file}...")
-        with open(self.json_file, 'r') as f:
-            self.original_data = json.load(f)
+        with open(self.json_file, 'rb') as f:
+            self.original_data = json.loads(f.read())
         
-        # Find all leaf nodes
+        # Find all leaf nodes, building the enhanced tree's skeleton on the same walk
         leaf_nodes = []
-        self._find_leaf_nodes(self.original_data, leaf_nodes)
+        leaf_refs = {}
+        enhanced_tree = self._find_leaf_nodes(self.original_data, leaf_nodes, leaf_refs=leaf_refs)
         
         if limit:
             leaf_nodes = leaf_nodes[:limit]
@@ -158,10 +190,13 @@ class OnlineJobsScraperEnhanced:
         print(f"\nStarting parallel scraping with {self.max_workers} workers...")
         start_time = time.time()
         
+        # Same overall rate as each worker waiting `delay` between its own requests
+        rate_limiter = RateLimiter(self.max_workers / delay if delay > 0 else 0)
+        
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # Submit all tasks
             future_to_skill = {
-                executor.submit(self._scrape_worker, skill_data, delay): skill_data
+                executor.submit(self._scrape_worker, skill_data, rate_limiter): skill_data
                 for skill_data in leaf_nodes
             }
             
@@ -171,98 +206,139 @@ class OnlineJobsScraperEnhanced:
                 try:
                     result = future.result()
                     
-                    # Thread-safe append to results
-                    with self.results_lock:
-                        self.results.append(result)
-                        job_counts[result['skill_id']] = result['job_count']
+                    # Only this loop touches results, so no lock is needed
+                    self.results.append(result)
+                    job_counts[result.skill_id] = result.job_count
+                    
+                    # Report progress from here rather than from the workers
+                    self.completed_count += 1
+                    if (result.status != "Success"
+                            or self.completed_count % _PROGRESS_EVERY == 0
+                            or self.completed_count == self.total_count):
+                        print(f"Progress: {self.completed_count}/{self.total_count} - {result.skill}: {result.job_count} jobs ({result.status})")
                         
                 except Exception as e:
                     skill_name, skill_id, path = skill_data
+                    self.completed_count += 1
                     print(f"Error scraping {skill_name}: {str(e)}")
                     
-                    with self.results_lock:
-                        self.results.append({
-                            'skill': skill_name,
-                            'path': path,
-                            'skill_id': skill_id,
-                            'job_count': 0,
-                            'status': f"Thread error: {str(e)}",
-                            'url': f"{self.base_url}{skill_id}",
-                            'timestamp': datetime.now().isoformat()
-                        })
+                    self.results.append(ScrapeRow(
+                        skill_name, path, skill_id, 0, f"Thread error: {str(e)}",
+                        f"{self.base_url}{skill_id}", datetime.now().isoformat()
+                    ))
         
         elapsed_time = time.time() - start_time
         print(f"\nScraping completed in {elapsed_time:.1f} seconds")
         print(f"Average time per skill: {elapsed_time/self.total_count:.2f} seconds")
         
-        # Create enhanced tree structure
+        # Fill the job counts into the enhanced tree structure
         print("\nCreating enhanced tree structure with job counts...")
-        self.enhanced_tree = self.process_tree_with_counts(self.original_data, job_counts)
+        self._fill_job_counts(enhanced_tree, leaf_refs, job_counts)
+        self.enhanced_tree = enhanced_tree
         
         # Calculate statistics
         self._calculate_statistics()
     
-    def _find_leaf_nodes(self, data: Dict, result: List, path: str = ""):
-        """Recursively find all leaf nodes"""
-        for key, value in data.items():
-            current_path = f"{path} > {key}" if path else key
-            
-            if isinstance(value, str):
-                result.append((key, value, current_path))
-            elif isinstance(value, dict):
-                self._find_leaf_nodes(value, result, current_path)
+    def _find_leaf_nodes(self, data: Dict, result: List, path: str = "",
+                         leaf_refs: Dict[str, List[Dict]] = None) -> Dict:
+        """Find all leaf nodes in depth-first key order and return the enhanced tree skeleton"""
+        # The skeleton mirrors data with zero counts; leaf_refs maps each skill id to
+        # its leaf entries so scraped counts can be filled in without another walk
+        skeleton = {}
+        
+        # Explicit stack of (items iterator, path, skeleton level) keeps the recursive
+        # visiting order without Python call overhead or a recursion depth limit
+        stack = [(iter(data.items()), path, skeleton)]
+        while stack:
+            items, parent_path, children = stack[-1]
+            for key, value in items:
+                current_path = parent_path + " > " + key if parent_path else key
+                
+                if isinstance(value, str):
+                    result.append((key, value, current_path))
+                    leaf = children[key] = {"id": value, "job_count": 0, "type": "leaf"}
+                    if leaf_refs is not None:
+                        leaf_refs.setdefault(value, []).append(leaf)
+                elif isinstance(value, dict):
+                    branch = children[key] = {"children": {}, "total_jobs": 0, "type": "branch"}
+                    stack.append((iter(value.items()), current_path, branch["children"]))
+                    break
+            else:
+                stack.pop()
+        
+        return skeleton
     
     def _calculate_statistics(self):
         """Calculate and display statistics"""
-        successful_results = [r for r in self.results if r['job_count'] > 0]
+        # One pass over the results for count, total, max and min
+        successful_count = 0
+        total_jobs = 0
+        max_jobs = 0
+        min_jobs = None
+        for r in self.results:
+            job_count = r.job_count
+            if job_count > 0:
+                successful_count += 1
+                total_jobs += job_count
+                if job_count > max_jobs:
+                    max_jobs = job_count
+                if min_jobs is None or job_count < min_jobs:
+                    min_jobs = job_count
         
-        if successful_results:
-            total_jobs = sum(r['job_count'] for r in successful_results)
-            avg_jobs = total_jobs / len(successful_results)
-            max_jobs = max(r['job_count'] for r in successful_results)
-            min_jobs = min(r['job_count'] for r in successful_results)
+        if successful_count:
+            avg_jobs = total_jobs / successful_count
             
             print(f"\nStatistics:")
             print(f"  Total skills scraped: {len(self.results)}")
-            print(f"  Successful scrapes: {len(successful_results)}")
+            print(f"  Successful scrapes: {successful_count}")
             print(f"  Total jobs found: {total_jobs:,}")
             print(f"  Average jobs per skill: {avg_jobs:.1f}")
             print(f"  Max jobs (single skill): {max_jobs:,}")
             print(f"  Min jobs (single skill): {min_jobs:,}")
     
+    def _write_file_atomic(self, filename: str, data: bytes):
+        """Write a file through a temporary sibling so readers never see it half-written"""
+        tmp_filename = filename + '.tmp'
+        with open(tmp_filename, 'wb', buffering=_WRITE_BUFFER) as f:
+            f.write(data)
+        os.replace(tmp_filename, filename)
+    
     def save_results(self):
         """Save all results and enhanced tree"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
+        # Serialize the enhanced tree once; both files get the same content
+        enhanced_json = json.dumps(self.enhanced_tree, indent=2, ensure_ascii=False).encode('utf-8')
+        
         # Save enhanced tree with job counts
         enhanced_filename = f"skills_with_jobs_{timestamp}.json"
-        with open(enhanced_filename, 'w', encoding='utf-8') as f:
-            json.dump(self.enhanced_tree, f, indent=2, ensure_ascii=False)
+        self._write_file_atomic(enhanced_filename, enhanced_json)
         print(f"\nEnhanced tree saved to {enhanced_filename}")
         
         # Save current enhanced tree for immediate use
-        with open("skills_with_jobs_current.json", 'w', encoding='utf-8') as f:
-            json.dump(self.enhanced_tree, f, indent=2, ensure_ascii=False)
+        self._write_file_atomic("skills_with_jobs_current.json", enhanced_json)
         print(f"Current enhanced tree saved to skills_with_jobs_current.json")
         
         # Save detailed results CSV (overwrite latest file)
         csv_filename = "job_scrape_details_latest.csv"
-        with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=self.results[0].keys())
-            writer.writeheader()
+        tmp_csv_filename = csv_filename + '.tmp'
+        with open(tmp_csv_filename, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
+            writer = csv.writer(f)
+            writer.writerow(ScrapeRow._fields)
             writer.writerows(self.results)
+        os.replace(tmp_csv_filename, csv_filename)
         print(f"Detailed results saved to {csv_filename}")
         
-        # Top skills by job count
-        sorted_results = sorted(
-            [r for r in self.results if r['job_count'] > 0], 
-            key=lambda x: x['job_count'], 
-            reverse=True
-        )[:20]
+        # Top skills by job count (nlargest keeps the same tie order as a stable sort)
+        sorted_results = heapq.nlargest(
+            20,
+            (r for r in self.results if r.job_count > 0),
+            key=attrgetter('job_count')
+        )
         
         print(f"\nTop 20 skills by job count:")
         for r in sorted_results:
-            print(f"  {r['skill']}: {r['job_count']:,} jobs")
+            print(f"  {r.skill}: {r.job_count:,} jobs")
 
 
 def main():
@@ -270,7 +346,7 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='Scrape job counts from OnlineJobs.ph')
-    parser.add_argument('--workers', type=int, help='Number of parallel workers (default: CPU count)')
+    parser.add_argument('--workers', type=int, help='Number of parallel workers (default: CPU count + 4, max 32)')
     parser.add_argument('--delay', type=float, default=1.5, help='Delay between requests per worker (default: 1.5)')
     parser.add_argument('--test', action='store_true', help='Test mode - scrape only 10 skills')
     parser.add_argument('--limit', type=int, help='Limit number of skills to scrape')
@@ -0,0 +1,45 @@
+"""Rate limiting and HTTP session helpers shared by the OnlineJobs.ph scrapers"""
+
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class RateLimiter:
+    """Token bucket shared by all workers that releases one request every 1/rate seconds"""
+    
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def wait(self):
+        """Block until the next request slot is due"""
+        if not self.interval:
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def create_session() -> requests.Session:
+    """Create a keep-alive session with retries for transient errors"""
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    })
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    # Every request goes to onlinejobs.ph and a thread has one request in flight,
+    # so a single kept-alive socket per session is enough
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session